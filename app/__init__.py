@@ -5,11 +5,12 @@ This package contains all the components for the job scraper application.
 """
 
 import os
-import yaml
 from flask import Flask
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+from app.utils.yaml_loader import load_yaml_file
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -35,12 +36,11 @@ def create_app(config_path=None):
     if config_path and os.path.exists(config_path):
         # Check file extension to determine how to load it
         if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-            with open(config_path, 'r') as config_file:
-                config_data = yaml.safe_load(config_file)
-                if 'app' in config_data and isinstance(config_data['app'], dict):
-                    app.config.update(config_data['app'])
-                else:
-                    app.config.update(config_data)
+            config_data = load_yaml_file(config_path)
+            if 'app' in config_data and isinstance(config_data['app'], dict):
+                app.config.update(config_data['app'])
+            else:
+                app.config.update(config_data)
         else:
             app.config.from_pyfile(config_path)
     else:
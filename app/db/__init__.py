@@ -5,6 +5,8 @@ This package handles database connections and operations.
 """
 
 import os
+import threading
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.ext.declarative import declarative_base
@@ -15,6 +17,13 @@ Base = declarative_base()
 # Global session factory
 Session = None
 
+def json_serializer(value):
+    """Encode a JSON column value with orjson (SQLAlchemy expects a str)."""
+    return orjson.dumps(value).decode('utf-8')
+
+# Decoding accepts the str SQLAlchemy passes in as-is
+json_deserializer = orjson.loads
+
 def init_db(app):
     """
     Initialize the database connection.
@@ -41,6 +50,8 @@ def init_db(app):
         pool_size=5,
         max_overflow=10,
         pool_recycle=3600,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
     
     # Create session factory
@@ -50,10 +61,14 @@ def init_db(app):
     # Import models after Base is defined
     from app.db.models import Job, ScraperRun  # noqa
     
-    # Create tables
-    @app.before_first_request
+    # Create tables on the first request (Flask 2.3 removed before_first_request)
+    tables_created = threading.Event()
+    
+    @app.before_request
     def create_tables():
-        Base.metadata.create_all(bind=engine)
+        if not tables_created.is_set():
+            Base.metadata.create_all(bind=engine)
+            tables_created.set()
 
 def get_session():
     """
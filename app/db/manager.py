@@ -7,13 +7,14 @@ session management, and basic database operations.
 
 import os
 import logging
-import yaml
 from typing import Optional, Tuple, Dict, Any
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError
+from app.db import json_serializer, json_deserializer
 from app.db.models import Base
+from app.utils.yaml_loader import load_yaml_file
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -50,7 +51,9 @@ class DatabaseManager:
                 max_overflow=db_options.get('max_overflow', 10),
                 pool_recycle=db_options.get('pool_recycle', 3600),
                 pool_timeout=db_options.get('pool_timeout', 30),
-                echo=db_options.get('echo', False)
+                echo=db_options.get('echo', False),
+                json_serializer=json_serializer,
+                json_deserializer=json_deserializer
             )
             
             # Create session factory
@@ -78,9 +81,8 @@ class DatabaseManager:
         # If not found in environment and config_path is provided, try config file
         if not db_url and config_path:
             try:
-                with open(config_path, 'r') as file:
-                    config = yaml.safe_load(file)
-                    
+                config = load_yaml_file(config_path)
+                
                 if config and 'database' in config and 'url' in config['database']:
                     db_url = config['database']['url']
             except Exception as e:
@@ -108,9 +110,8 @@ class DatabaseManager:
         # If config_path is provided, try to load options from config file
         if config_path:
             try:
-                with open(config_path, 'r') as file:
-                    config = yaml.safe_load(file)
-                    
+                config = load_yaml_file(config_path)
+                
                 if config and 'database' in config:
                     # Remove 'url' from options if present
                     db_config = config['database'].copy()
@@ -194,3 +195,19 @@ class DatabaseManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+# Shared instance, created on first use so importing this module stays cheap
+_db_manager: Optional[DatabaseManager] = None
+
+
+def get_db_manager() -> DatabaseManager:
+    """Get the shared database manager instance.
+    
+    Returns:
+        DatabaseManager instance
+    """
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager()
+    return _db_manager
@@ -48,7 +48,7 @@ class Job(Base):
     source_website = Column(String(100), nullable=False)
     still_active = Column(Boolean, default=True)
     last_check_date = Column(DateTime)
-    metadata = Column(JSON)
+    metadata_ = Column('metadata', JSON)
     
     # Relationships
     tags = relationship("Tag", secondary=job_tags, back_populates="jobs")
@@ -10,7 +10,7 @@ Import the setup_monitoring function to initialize all monitoring components
 with a Flask application instance.
 """
 
-from app.monitoring.metrics import setup_metrics
+from app.monitoring.metrics import setup_monitoring as setup_metrics
 from app.monitoring.health import create_health_endpoints
 
 
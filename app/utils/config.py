@@ -8,12 +8,12 @@ and environment variables, providing a centralized configuration system.
 import json
 import logging
 import os
-import yaml
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from .log_setup import get_logger
+from .yaml_loader import load_yaml_file
 
 # Central logger for ConfigManager
 logger = get_logger("ConfigManager")
@@ -92,12 +92,11 @@ class ConfigManager:
         """Load configuration from the specified YAML file."""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    file_config = yaml.safe_load(f)
-                    if file_config:
-                        for section in self.config:
-                            if section in file_config:
-                                self.config[section].update(file_config[section])
+                file_config = load_yaml_file(self.config_path)
+                if file_config:
+                    for section in self.config:
+                        if section in file_config:
+                            self.config[section].update(file_config[section])
             except Exception as e:
                 print(f"Error loading config file {self.config_path}: {str(e)}")
     
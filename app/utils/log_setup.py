@@ -8,12 +8,13 @@ supporting both structured logging to files and console output.
 import os
 import logging
 import logging.config
-import yaml
 import json
 from typing import Any, Dict, Optional
 from datetime import datetime
 from pathlib import Path
 
+from .yaml_loader import load_yaml_file
+
 # Default logging configuration
 DEFAULT_LOG_CONFIG = {
     "version": 1,
@@ -144,9 +145,8 @@ def setup_logging(config_path: Optional[str] = None, default_level: str = "INFO"
     # Load configuration file if provided and exists
     if config_path and os.path.exists(config_path):
         try:
-            with open(config_path, "rt", encoding="utf-8") as f:
-                loaded_config = yaml.safe_load(f.read())
-                log_config.update(loaded_config)
+            loaded_config = load_yaml_file(config_path)
+            log_config.update(loaded_config)
         except Exception as e:
             print(f"Error loading logging configuration from {config_path}: {e}")
     
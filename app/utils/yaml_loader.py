@@ -0,0 +1,121 @@
+"""
+YAML Loading Helpers for Job Scraper Application
+
+This module picks the fastest available safe YAML loader and dumper so that
+configuration files are parsed by libyaml when PyYAML was built with it,
+and caches parsed files so repeated app start-ups do not re-parse them.
+A JSON copy of each parsed file is kept next to it (``<file>.json``) so that
+new worker processes can skip YAML parsing altogether. The copy records the
+size and modification time of the YAML it was made from and is only used
+while both still match exactly.
+"""
+
+import copy
+import os
+import tempfile
+from functools import lru_cache
+from typing import Any, IO, List, Union
+
+import orjson
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    # PyYAML without libyaml; the pure-Python classes behave the same, only slower
+    from yaml import SafeLoader, SafeDumper
+
+
+def safe_load(stream: Union[str, bytes, IO]) -> Any:
+    """Parse a YAML document with the safe loader (drop-in for yaml.safe_load).
+
+    Args:
+        stream: YAML text or an open file
+
+    Returns:
+        The parsed document
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def _sidecar_path(path: str) -> str:
+    """Return the path of the JSON cache kept next to a YAML file."""
+    return path + '.json'
+
+
+def _write_sidecar(path: str, source: List[int], data: Any) -> None:
+    """Atomically write the parsed document to its JSON sidecar.
+
+    Best effort only: read-only config directories and documents that do not
+    survive a JSON round trip unchanged (dates, NaN, ...) simply leave the
+    YAML file as the source of truth.
+    """
+    directory = os.path.dirname(path)
+    if not os.access(directory, os.W_OK):
+        return
+    try:
+        # Dates must stay dates, so refuse them instead of writing strings
+        payload = orjson.dumps({'source': source, 'data': data},
+                               option=orjson.OPT_PASSTHROUGH_DATETIME)
+    except TypeError:
+        return
+    # NaN becomes null and the like; equality catches every lossy value
+    if orjson.loads(payload)['data'] != data:
+        return
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, _sidecar_path(path))
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file once per (path, modification time, size).
+
+    A JSON sidecar made from exactly this version of the YAML file is loaded
+    instead of parsing the YAML; otherwise the YAML is parsed and the sidecar
+    refreshed. Copies that preserve timestamps (``cp -p``, rsync, tar) can give
+    a replaced file an older mtime, so the sidecar's age alone proves nothing.
+    """
+    source = [mtime_ns, size]
+    try:
+        with open(_sidecar_path(path), 'rb') as f:
+            cached = orjson.loads(f.read())
+        if isinstance(cached, dict) and cached.get('source') == source and 'data' in cached:
+            return cached['data']
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = safe_load(f)
+    _write_sidecar(path, source, data)
+    return data
+
+
+def load_yaml_file(path: str) -> Any:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    The cache is keyed by the file's modification time and size, so edits are
+    picked up on the next call. A deep copy is returned because callers merge
+    and modify the loaded configuration.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        The parsed document
+    """
+    abs_path = os.path.abspath(path)
+    st = os.stat(abs_path)
+    return copy.deepcopy(_load_yaml_cached(abs_path, st.st_mtime_ns, st.st_size))
+
+
+def clear() -> None:
+    """Drop all cached YAML documents (mainly for tests)."""
+    _load_yaml_cached.cache_clear()
@@ -37,7 +37,7 @@ class ImportRequestSchema(Schema):
     """Validation schema for import requests."""
     file = fields.String(required=True)
     format = fields.String(required=False)
-    update_existing = fields.Boolean(required=False, default=True)
+    update_existing = fields.Boolean(required=False, load_default=True)
 
 
 # Global state for mock scraper status
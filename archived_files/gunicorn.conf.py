@@ -0,0 +1,40 @@
+"""
+Gunicorn configuration for the job scraper web interface.
+
+Usage:
+    gunicorn -c gunicorn.conf.py
+
+The application is built through the ``create_app()`` factory in
+``src/web_app.py``. Workers use gevent so that a slow database call or
+download only parks one greenlet instead of the whole process.
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = "src.web_app:create_app()"
+
+bind = f"{os.environ.get('WEB_HOST', '0.0.0.0')}:{os.environ.get('WEB_PORT', '5000')}"
+workers = int(os.environ.get("WEB_WORKERS", multiprocessing.cpu_count()))
+worker_class = os.environ.get("WEB_WORKER_CLASS", "gevent")
+worker_connections = int(os.environ.get("WEB_WORKER_CONNECTIONS", "1000"))
+timeout = int(os.environ.get("WEB_TIMEOUT", "120"))
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    """Make psycopg2 cooperative inside gevent workers.
+
+    The gevent worker monkey-patches the standard library on start-up, but
+    libpq does its own socket I/O, so without a wait callback every query
+    would still block the whole worker.
+    """
+    if worker_class != "gevent":
+        return
+    try:
+        from psycogreen.gevent import patch_psycopg
+    except ImportError:
+        server.log.warning("psycogreen not installed; psycopg2 calls will block gevent workers")
+        return
+    patch_psycopg()
@@ -1,6 +1,7 @@
+import importlib
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
 from flask import Flask, render_template
 from flask_bootstrap import Bootstrap
@@ -17,10 +18,20 @@ from .utils.logging import setup_logger
 # Configure logger
 logger = setup_logger("app")
 
+# Blueprints as (module, attribute, url_prefix); modules are imported only
+# when their blueprint is registered
+BLUEPRINTS: List[Tuple[str, str, Optional[str]]] = [
+    (".blueprints.dashboard.routes", "dashboard_bp", None),
+    (".blueprints.scraper.routes", "scraper_bp", "/scraper"),
+    (".blueprints.data_management.routes", "data_bp", "/data"),
+    (".blueprints.api.routes", "api_bp", "/api"),
+]
+
 def create_app(
     config_path: str = "config/api_config.yaml",
     db_connection_string: Optional[str] = None,
-    testing: bool = False
+    testing: bool = False,
+    blueprints: Optional[Iterable[str]] = None
 ) -> Flask:
     """
     Create and configure the Flask application using the Application Factory pattern.
@@ -29,6 +40,7 @@ def create_app(
         config_path: Path to configuration file
         db_connection_string: Database connection string (optional)
         testing: Whether the app is in testing mode
+        blueprints: Names of the blueprints to register (default: all)
         
     Returns:
         Configured Flask application
@@ -69,7 +81,7 @@ def create_app(
         setup_auth(app)
     
     # Register blueprints
-    register_blueprints(app)
+    register_blueprints(app, blueprints)
     
     # Register error handlers
     register_error_handlers(app)
@@ -131,24 +143,25 @@ def init_services(
     
     logger.info("Application services initialized")
 
-def register_blueprints(app: Flask) -> None:
+def register_blueprints(app: Flask, names: Optional[Iterable[str]] = None) -> None:
     """
     Register Flask blueprints.
     
+    Blueprint modules are imported here rather than at module level, which
+    also avoids circular imports. Passing ``names`` registers only those
+    blueprints, so a test for one view does not import every view module.
+    
     Args:
         app: Flask application
+        names: Blueprint attribute names to register (default: all)
     """
-    # Import blueprints at function level to avoid circular imports
-    from .blueprints.dashboard.routes import dashboard_bp
-    from .blueprints.scraper.routes import scraper_bp
-    from .blueprints.data_management.routes import data_bp
-    from .blueprints.api.routes import api_bp
+    wanted = set(names) if names is not None else None
     
-    # Register blueprints
-    app.register_blueprint(dashboard_bp)
-    app.register_blueprint(scraper_bp, url_prefix='/scraper')
-    app.register_blueprint(data_bp, url_prefix='/data')
-    app.register_blueprint(api_bp, url_prefix='/api')
+    for module_path, attr, url_prefix in BLUEPRINTS:
+        if wanted is not None and attr not in wanted:
+            continue
+        module = importlib.import_module(module_path, __package__)
+        app.register_blueprint(getattr(module, attr), url_prefix=url_prefix)
     
     logger.info("Application blueprints registered")
 
@@ -1,16 +1,70 @@
+import copy
 import json
 import logging
 import os
+import tempfile
+import threading
 import yaml
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# Prefer the libyaml-backed loader/dumper; fall back to the pure-Python ones
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 from .log_setup import get_logger
 
 # Central logger for ConfigManager
 logger = get_logger("ConfigManager")
 
+# Parsed config files keyed by absolute path -> ((mtime_ns, size), config).
+# Shared across ConfigManager instances so each new scraper does not re-parse YAML.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _file_signature(path: str) -> Tuple[int, int]:
+    """Return (mtime_ns, size) used to detect changes to a config file."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_yaml_config(path: str) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, reusing the cached result while the file is unchanged.
+
+    Returns a deep copy so callers can mutate it without touching the cache.
+    """
+    key = os.path.abspath(path)
+    signature = _file_signature(key)
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+        if cached is None or cached[0] != signature:
+            with open(key, "r", encoding="utf-8") as f:
+                config = yaml.load(f, Loader=SafeLoader) or {}
+            cached = (signature, config)
+            _CONFIG_CACHE[key] = cached
+        return copy.deepcopy(cached[1])
+
+
+def _write_yaml_config(path: str, config: Dict[str, Any]) -> None:
+    """Atomically replace a YAML config file and drop its cached parse."""
+    key = os.path.abspath(path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(key), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False)
+        os.replace(tmp_path, key)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+    finally:
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE.pop(key, None)
+
 
 class ConfigManager:
     """
@@ -41,8 +95,8 @@ class ConfigManager:
         and parse it into class attributes (api_config, request_config, scraper_config, etc.).
         """
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            self._config_signature = _file_signature(self.config_path)
+            config = _read_yaml_config(self.config_path)
 
             # Sections from YAML
             self.api_config: Dict[str, Any] = config.get("api", {})
@@ -69,6 +123,22 @@ class ConfigManager:
             logger.error(f"Unexpected error loading configuration: {str(e)}")
             raise
 
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the configuration if the YAML file changed on disk since it was loaded.
+
+        Returns:
+            bool: True if the configuration was reloaded.
+        """
+        try:
+            if _file_signature(self.config_path) == self._config_signature:
+                return False
+        except OSError as e:
+            logger.error(f"Error checking configuration file: {str(e)}")
+            return False
+        self._load_config()
+        return True
+
     def load_state(self) -> Dict[str, Any]:
         """
         Load the latest scraper state from a JSON file, or return an empty dict if none exists.
@@ -217,15 +287,13 @@ class ConfigManager:
             value (Any): New value to store.
         """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = _read_yaml_config(self.config_path)
 
             if section not in config:
                 config[section] = {}
             config[section][key] = value
 
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            _write_yaml_config(self.config_path, config)
 
             # Reload the config into memory
             self._load_config()
@@ -255,15 +323,13 @@ class ConfigManager:
             new_config['last_updated'] = datetime.now().isoformat()
             
             # Load current full config
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = _read_yaml_config(self.config_path)
             
             # Update scraper section
             config['scraper'] = new_config
             
-            # Write updated config back to file
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            # Write updated config back to file atomically
+            _write_yaml_config(self.config_path, config)
             
             # Reload config to ensure changes are in memory
             self._load_config()
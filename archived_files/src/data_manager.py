@@ -19,6 +19,7 @@ import aiofiles
 import aiohttp
 import asyncpg
 import boto3
+import orjson
 import pandas as pd
 from botocore.exceptions import ClientError
 
@@ -867,11 +868,11 @@ class DataManager:
             # Ensure JSON fields are properly formatted
             for field in ["locations", "work_types", "salary", "tags", "job_post_categories", "raw_data"]:
                 if field in cleaned_job:
-                    # If string, try to parse as JSON
+                    # If string, try to parse as JSON (values already decoded skip this)
                     if isinstance(cleaned_job[field], str):
                         try:
-                            cleaned_job[field] = json.loads(cleaned_job[field])
-                        except json.JSONDecodeError:
+                            cleaned_job[field] = orjson.loads(cleaned_job[field])
+                        except orjson.JSONDecodeError:
                             # If parsing fails, use an appropriate default
                             if field in ["locations", "work_types", "tags", "job_post_categories"]:
                                 cleaned_job[field] = []
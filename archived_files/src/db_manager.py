@@ -316,12 +316,42 @@ class DatabaseManager:
             await conn.execute(
                 f"CREATE INDEX IF NOT EXISTS idx_jobs_activation_time ON {self.schema}.jobs (activation_time)"
             )
+            await conn.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS jobs_activation_time_desc_idx
+                ON {self.schema}.jobs (activation_time DESC NULLS LAST)
+                INCLUDE (id, title, company_name_en, url)
+                """
+            )
+            await conn.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS jobs_activation_time_id_idx
+                ON {self.schema}.jobs (activation_time DESC NULLS LAST, id DESC)
+                """
+            )
             await conn.execute(
                 f"CREATE INDEX IF NOT EXISTS idx_jobs_batch_id ON {self.schema}.jobs (batch_id)"
             )
             await conn.execute(
                 f"CREATE INDEX IF NOT EXISTS idx_jobs_company_id ON {self.schema}.jobs (company_id) WHERE company_id IS NOT NULL"
             )
+            # Expression index for the per-province stats query.
+            await conn.execute(
+                f"CREATE INDEX IF NOT EXISTS jobs_province_idx "
+                f"ON {self.schema}.jobs ((locations->0->'province'->>'name'))"
+            )
+            # Trigram indexes so the search page's ILIKE '%term%' filters avoid seq scans.
+            # Creating the extension needs privileges the app role may lack; the
+            # search still works without it, only slower.
+            try:
+                await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                for column in ("title", "company_name_en", "company_name_fa"):
+                    await conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS jobs_{column}_trgm_idx "
+                        f"ON {self.schema}.jobs USING gin ({column} gin_trgm_ops)"
+                    )
+            except asyncpg.exceptions.PostgresError as e:
+                logger.warning(f"Skipping trigram search indexes (pg_trgm unavailable): {e}")
 
             # Trigger function to auto-update the 'updated_at' column.
             await conn.execute(
@@ -1,21 +1,33 @@
+import atexit
 import os
+import csv
+import errno
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Union, Tuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Optional, Union, Tuple
 import zipfile
+import shutil
+import subprocess
+import tempfile
 import threading
 import yaml
 import io
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from urllib.parse import quote, urlencode
 
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for, flash
+from flask import Flask, Response, g, has_request_context, render_template, request, jsonify, send_file, redirect, url_for, flash, stream_with_context
 from flask_bootstrap import Bootstrap
 from werkzeug.utils import secure_filename
-import pandas as pd
+import orjson
 import psycopg2
 import psycopg2.extras
-import requests
+import psycopg2.pool
 
 from .db_manager import DatabaseManager
 from .data_manager import DataManager
@@ -23,11 +35,320 @@ from .scraper import JobScraper
 from .log_setup import get_logger
 from .config_manager import ConfigManager
 from .filters import register_filters
+from .utils.auth import api_auth_required
 from .monitoring import setup_monitoring, TOTAL_JOBS, NEW_JOBS, ERRORS, RETRIES
 
+try:
+    import connectorx as cx
+except ImportError:
+    # connectorx is optional; exports fall back to psycopg2 + pandas
+    cx = None
+
+try:
+    import xlsxwriter
+except ImportError:
+    # xlsxwriter is optional; Excel exports fall back to openpyxl's write-only mode
+    xlsxwriter = None
+
+try:
+    import zstandard
+except ImportError:
+    # zstandard is optional; compressed exports fall back to zip
+    zstandard = None
+
+try:
+    from blake3 import blake3 as checksum_hasher
+    CHECKSUM_ALGORITHM = "blake3"
+except ImportError:
+    # blake3 is optional; BLAKE2 from the stdlib is the closest fallback
+    from hashlib import blake2b as checksum_hasher
+    CHECKSUM_ALGORITHM = "blake2b"
+
+# pandas, pyarrow, openpyxl and requests are imported inside the views that
+# need them, so importing this module (CLI tools, test collection) stays cheap
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 # Configure logger
 logger = get_logger("web_app")
 
+# jsonb columns (locations, tags, salary, ...) arrive already decoded; parse them with orjson
+psycopg2.extras.register_default_jsonb(globally=True, loads=orjson.loads)
+
+# Buffer size used when streaming files and subprocess output through Python
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Size of the per-process database connection pool
+DB_POOL_MIN_CONN = int(os.environ.get("DB_POOL_MIN_CONN", "4"))
+DB_POOL_MAX_CONN = int(os.environ.get("DB_POOL_MAX_CONN", "25"))
+
+# Seconds an /api/stats result is reused before the aggregates are re-run
+STATS_CACHE_TTL = int(os.environ.get("STATS_CACHE_TTL", "60"))
+
+# Columns rendered on the search results page; the jobs table created by
+# DatabaseManager has no description column, so none is selected
+SEARCH_RESULT_COLUMNS = (
+    "id, title, company_name_en, company_name_fa, activation_time, url, "
+    "locations, work_types"
+)
+
+# Columns that may be requested with ?columns= on search exports
+EXPORTABLE_JOB_COLUMNS = frozenset({
+    "id", "title", "company_name_en", "company_name_fa", "url",
+    "activation_time", "expiration_time", "locations", "job_categories", "tags",
+    "work_types", "salary", "job_post_categories", "created_at", "updated_at",
+    "batch_id"
+})
+
+# Bytes from the end of a failed restore's stderr that are logged
+RESTORE_ERROR_TAIL_BYTES = 64 * 1024
+
+# Threads used to copy export files during a restore; copies are I/O-bound,
+# and network filesystems benefit from many requests in flight
+RESTORE_COPY_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Seconds to wait for a new database connection
+DB_CONNECT_TIMEOUT = 5
+
+# Seconds a request waits for a free pooled connection before getting a 503
+DB_POOL_WAIT_TIMEOUT = float(os.environ.get("DB_POOL_WAIT_TIMEOUT", "10"))
+
+# Rows fetched per round trip by server-side export cursors
+EXPORT_FETCH_SIZE = 5000
+
+# Seconds between refreshes of the TOTAL_JOBS gauge
+JOB_COUNT_REFRESH_INTERVAL = 60
+
+# Metric children with fixed labels, resolved once
+SCRAPING_ERRORS = ERRORS.labels(type="scraping")
+SCRAPER_THREAD_ERRORS = ERRORS.labels(type="scraper_thread")
+SCRAPER_START_ERRORS = ERRORS.labels(type="scraper_start")
+DB_ERRORS = ERRORS.labels(type="database")
+DB_CONN_ERRORS = ERRORS.labels(type="database_connection")
+
+# Superset dashboards linked from the analytics page: (id, title, description)
+ANALYTICS_DASHBOARDS = (
+    ("job-market-trends", "Job Market Trends", "Overview of job posting trends and metrics"),
+    ("salary-analysis", "Salary Analysis", "Analysis of salary distributions across jobs"),
+)
+
+# Characters not allowed in stored upload filenames
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+def _fast_secure(filename: str) -> str:
+    """
+    Make an uploaded filename safe to store in the upload folder.
+    
+    Directory components are dropped, unsafe characters collapse to '_'
+    and leading dots are removed so the result cannot be hidden or escape
+    the folder.
+    """
+    name = _UNSAFE_FILENAME_RE.sub('_', os.path.basename(filename)).lstrip('.')
+    return name[:255] or 'upload'
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """
+    Copy a file's contents and metadata without passing the data through Python.
+    
+    Uses copy_file_range (which can reflink on btrfs/xfs), falls back to
+    sendfile where the filesystem does not support it, and finally to
+    shutil.copy2 on platforms that have neither.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    sendfile = getattr(os, "sendfile", None)
+    if copy_file_range is None and sendfile is None:
+        shutil.copy2(src, dst)
+        return
+    
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while True:
+                # Both calls advance the file offsets, so a fallback picks up
+                # where the previous call stopped
+                if copy_file_range is not None:
+                    try:
+                        copied = copy_file_range(src_fd, dst_fd, 1 << 30)
+                    except OSError as e:
+                        if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                            raise
+                        copy_file_range = None
+                        continue
+                else:
+                    copied = sendfile(dst_fd, src_fd, None, 1 << 30)
+                if copied == 0:
+                    break
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    shutil.copystat(src, dst)
+
+
+@lru_cache(maxsize=64)
+def _compile_search_sql(
+    schema: str,
+    columns: str,
+    has_keyword: bool,
+    has_location: bool,
+    has_company: bool,
+    has_days: bool,
+    sort: str,
+    paginate: bool,
+    keyset: bool = False,
+    keyset_null: bool = False,
+    trigram: bool = True
+) -> str:
+    """
+    Build the search SQL for a combination of active filters.
+    
+    The text only depends on which filters are set, not on their values,
+    so it is built once per combination. Identical text also lets
+    PostgreSQL reuse the cached plan.
+    
+    With `keyset` (date sort only) the page starts after a given
+    (activation_time, id) instead of skipping OFFSET rows, so deep pages
+    cost the same as the first one. Jobs without an activation_time sort
+    last: they follow any dated position, and with `keyset_null` the page
+    starts after a given id among them.
+    
+    Without `trigram` (pg_trgm not installed) the relevance sort falls
+    back to putting title matches first.
+    """
+    # The window count is computed over the filtered rows before
+    # LIMIT/OFFSET are applied
+    total_column = ", COUNT(*) OVER () AS _total" if paginate else ""
+    query = f"""
+        SELECT {columns}{total_column} FROM {schema}.jobs
+        WHERE 1=1
+        """
+    
+    # Keyword filter on the title, which has a trigram index (the jobs
+    # table has no description column)
+    if has_keyword:
+        query += " AND title ILIKE %s"
+    
+    # Location filter
+    if has_location:
+        query += " AND locations::text ILIKE %s"
+    
+    # Company filter (search in company_name_en, company_name_fa)
+    if has_company:
+        query += " AND (company_name_en ILIKE %s OR company_name_fa ILIKE %s)"
+    
+    # Date filter
+    if has_days:
+        query += " AND activation_time >= %s"
+    
+    # Keyset position (rows after the last one of the previous page)
+    if keyset and keyset_null:
+        query += " AND activation_time IS NULL AND id < %s"
+    elif keyset:
+        query += " AND ((activation_time, id) < (%s, %s) OR activation_time IS NULL)"
+    
+    # Sorting
+    if sort == 'date':
+        query += " ORDER BY activation_time DESC NULLS LAST, id DESC"
+    elif sort == 'company':
+        query += " ORDER BY company_name_en ASC NULLS LAST, company_name_fa ASC NULLS LAST"
+    elif sort == 'relevance':
+        if has_keyword and trigram:
+            # Rank by trigram similarity of the title (pg_trgm)
+            query += " ORDER BY similarity(title, %s) DESC, activation_time DESC NULLS LAST"
+        elif has_keyword:
+            query += " ORDER BY CASE WHEN title ILIKE %s THEN 0 ELSE 1 END, activation_time DESC NULLS LAST"
+        else:
+            query += " ORDER BY activation_time DESC NULLS LAST"
+    
+    # Pagination
+    if paginate:
+        query += " LIMIT %s" if keyset else " LIMIT %s OFFSET %s"
+    
+    return query
+
+
+def _parse_keyset_cursor(
+    after_time: Optional[str],
+    after_id: Optional[str]
+) -> Optional[Tuple[Optional[datetime], str]]:
+    """
+    Parse the after_time/after_id search parameters; None if absent or invalid.
+    
+    A cursor without after_time points into the trailing jobs that have no
+    activation_time.
+    """
+    if not after_id:
+        return None
+    if not after_time:
+        return None, after_id
+    try:
+        return datetime.fromisoformat(after_time), after_id
+    except ValueError:
+        return None
+
+
+def _extract_zip_members(
+    zipf: zipfile.ZipFile,
+    dest_dir: Path,
+    names: Iterable[str],
+    prefixes: Iterable[str]
+) -> int:
+    """
+    Extract the archive entries named in `names` or under one of `prefixes`.
+    
+    Entries are copied in COPY_BUFFER_SIZE chunks; entries that would land
+    outside dest_dir are skipped.
+    
+    Returns:
+        Number of entries extracted
+    """
+    names = set(names)
+    prefixes = tuple(prefixes)
+    dest_root = dest_dir.resolve()
+    count = 0
+    for info in zipf.infolist():
+        if info.is_dir():
+            continue
+        if info.filename not in names and not info.filename.startswith(prefixes):
+            continue
+        target = (dest_root / info.filename).resolve()
+        if not target.is_relative_to(dest_root):
+            logger.warning(f"Skipping unsafe path in backup: {info.filename}")
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with zipf.open(info) as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        count += 1
+    return count
+
+
+@lru_cache(maxsize=8)
+def _analytics_dashboards(superset_url: str) -> Tuple[MappingProxyType, ...]:
+    """Build the read-only dashboard entries for the analytics page."""
+    return tuple(
+        MappingProxyType({
+            "title": title,
+            "id": dashboard_id,
+            "description": description,
+            "url": f"{superset_url}/superset/dashboard/{dashboard_id}/"
+        })
+        for dashboard_id, title, description in ANALYTICS_DASHBOARDS
+    )
+
+
+def _excel_value(value: Any) -> Any:
+    """Convert a database value into something openpyxl can store in a cell."""
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value).decode('utf-8')
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        # Excel has no time zones
+        return value.replace(tzinfo=None)
+    return value
+
+
 class JobScraperWebApp:
     """
     Web interface for the job scraper application.
@@ -55,6 +376,7 @@ class JobScraperWebApp:
         """
         self.app = Flask(__name__)
         self.app.secret_key = os.environ.get("FLASK_SECRET_KEY", "development-key")
+        self._url_for_map: Optional[Dict[str, bool]] = None
         
         # Add context processor to make current_year available in all templates
         @self.app.context_processor
@@ -64,20 +386,23 @@ class JobScraperWebApp:
         # Add context processor to inject url_for_map to templates
         @self.app.context_processor
         def inject_url_for_map():
-            # Get all available endpoint names
-            url_for_map = {}
-            for rule in self.app.url_map.iter_rules():
-                # Store full endpoint name including blueprint prefix
-                url_for_map[rule.endpoint] = True
-                
-                # For blueprint endpoints, also store without the blueprint prefix
-                # This makes templates more resilient to blueprint refactoring
-                if '.' in rule.endpoint:
-                    parts = rule.endpoint.split('.')
-                    if len(parts) > 1:
-                        url_for_map[parts[-1]] = True
-                        
-            return {"url_for_map": url_for_map}
+            # The url_map does not change once requests are being served,
+            # so the endpoint map is built on first render and reused
+            if self._url_for_map is None:
+                self._url_for_map = self._build_url_for_map()
+            return {"url_for_map": self._url_for_map}
+        
+        # Requests that could not get a pooled connection answer 503, even
+        # when the view caught the error and built its own response
+        @self.app.after_request
+        def replace_pool_exhausted_response(response):
+            if g.get("db_pool_exhausted"):
+                return self._pool_exhausted_response()
+            return response
+        
+        self.app.errorhandler(psycopg2.pool.PoolError)(
+            lambda e: self._pool_exhausted_response()
+        )
         
         # Configure Bootstrap
         Bootstrap(self.app)
@@ -97,20 +422,33 @@ class JobScraperWebApp:
         self.app.config['UPLOAD_FOLDER'] = str(self.upload_folder)
         self.app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB limit
         
+        # Hand downloads off to nginx when it is configured for X-Accel-Redirect
+        self.use_xaccel = os.environ.get("USE_XACCEL", "0").lower() in ("1", "true", "yes")
+        
         # Initialize components
         self.config_manager = ConfigManager(config_path)
         
-        # Get database connection string
-        if not db_connection_string:
-            db_config = self.config_manager.database_config
-            self.db_connection_string = db_config.get("connection_string", self._build_db_connection_string())
-        else:
-            self.db_connection_string = db_connection_string
+        # The database connection settings are resolved once, on first use
+        # (see db_connection_string); handlers reuse them through a
+        # connection pool that is also opened on first use
+        self._db_connection_string_arg = db_connection_string
+        self._db_pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+        self._db_pool_lock = threading.Lock()
+        
+        # ThreadedConnectionPool.getconn() fails at once when every connection
+        # is checked out; this semaphore (sized to maxconn) makes callers wait
+        self._db_pool_slots: Optional[threading.BoundedSemaphore] = None
             
         # Initialize managers
         self.db_manager = None
         self.data_manager = None
         
+        # Last /api/stats result and when it was computed
+        self._stats_cache: Dict[str, Any] = {"ts": 0.0, "payload": None}
+        
+        # Background thread keeping the job count metric current
+        self._job_count_thread: Optional[threading.Thread] = None
+        
         # Initialize scraper state
         self.scraper_running = False
         self.current_scraper_task = None
@@ -123,7 +461,184 @@ class JobScraperWebApp:
         # Register routes
         self._register_routes()
         
-    def _build_db_connection_string(self) -> str:
+    @cached_property
+    def db_connection_string(self) -> str:
+        """
+        Database connection string, resolved once per application.
+        
+        An explicit constructor argument wins, then the configured
+        connection string, then one built from environment variables.
+        """
+        if self._db_connection_string_arg:
+            return self._db_connection_string_arg
+        connection_string = self.config_manager.database_config.get("connection_string")
+        if connection_string is None:
+            connection_string = self._build_db_connection_string()
+        return connection_string
+        
+    @cached_property
+    def _dsn_params(self) -> Dict[str, str]:
+        """Connection parameters parsed from db_connection_string."""
+        return psycopg2.extensions.parse_dsn(self.db_connection_string)
+        
+    @cached_property
+    def _connectorx_url(self) -> str:
+        """
+        db_connection_string as a postgresql:// URL.
+        
+        connectorx only accepts URLs, while the configured connection string
+        may be a keyword/value DSN.
+        """
+        params = dict(self._dsn_params)
+        user = params.pop("user", "")
+        password = params.pop("password", "")
+        host = params.pop("host", "localhost")
+        port = params.pop("port", "")
+        dbname = params.pop("dbname", "")
+        
+        userinfo = quote(user, safe="")
+        if password:
+            userinfo += ":" + quote(password, safe="")
+        netloc = f"{userinfo}@{host}" if userinfo else host
+        if port:
+            netloc += f":{port}"
+        url = f"postgresql://{netloc}/{quote(dbname, safe='')}"
+        if params:
+            url += "?" + urlencode(params)
+        return url
+        
+    @cached_property
+    def _has_pg_trgm(self) -> bool:
+        """
+        Whether the pg_trgm extension (and so similarity()) is installed.
+        
+        DatabaseManager only warns when it may not create the extension,
+        so the search must not assume it.
+        """
+        with self._cursor(cursor_factory=None) as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            return cursor.fetchone() is not None
+        
+    def reload_dsn(self) -> None:
+        """
+        Re-resolve the database connection settings.
+        
+        Call this only if the database configuration has been changed while
+        the application is running.
+        """
+        self.__dict__.pop("db_connection_string", None)
+        self.__dict__.pop("_dsn_params", None)
+        self.__dict__.pop("_has_pg_trgm", None)
+        self.__dict__.pop("_connectorx_url", None)
+        
+        # Connections in an existing pool point at the old database
+        self.close_db_pool()
+        
+    def _get_db_pool(self) -> psycopg2.pool.ThreadedConnectionPool:
+        """
+        Return the connection pool, creating it on first use.
+        
+        The size comes from the database config section (pool_min/pool_max),
+        falling back to DB_POOL_MIN_CONN/DB_POOL_MAX_CONN.
+        """
+        with self._db_pool_lock:
+            if self._db_pool is None:
+                db_config = self.config_manager.database_config
+                max_conn = int(db_config.get("pool_max", DB_POOL_MAX_CONN))
+                self._db_pool = psycopg2.pool.ThreadedConnectionPool(
+                    int(db_config.get("pool_min", DB_POOL_MIN_CONN)),
+                    max_conn,
+                    **{"connect_timeout": DB_CONNECT_TIMEOUT, **self._dsn_params}
+                )
+                self._db_pool_slots = threading.BoundedSemaphore(max_conn)
+            return self._db_pool
+        
+    def warm_db_pool(self) -> None:
+        """
+        Open the pool and check its idle connections at startup.
+        
+        Every connection the pool keeps runs a SELECT 1 concurrently, so the
+        first requests do not pay for the connection handshake.
+        """
+        pool = self._get_db_pool()
+        
+        def ping(_):
+            with self._cursor(cursor_factory=None) as cursor:
+                cursor.execute("SELECT 1")
+        
+        with ThreadPoolExecutor(max_workers=pool.minconn or 1) as executor:
+            list(executor.map(ping, range(pool.minconn)))
+        
+    def close_db_pool(self) -> None:
+        """Close all pooled connections."""
+        with self._db_pool_lock:
+            if self._db_pool is not None:
+                self._db_pool.closeall()
+                self._db_pool = None
+        
+    @contextmanager
+    def _cursor(self, cursor_factory=psycopg2.extras.DictCursor, name: Optional[str] = None):
+        """
+        Yield a cursor on a pooled connection.
+        
+        The connection always goes back to the pool; any open transaction is
+        rolled back by the pool, and broken connections are discarded.
+        
+        Args:
+            cursor_factory: Cursor class to use (DictCursor by default)
+            name: Name for a server-side cursor (optional)
+        """
+        pool = self._get_db_pool()
+        slots = self._db_pool_slots
+        
+        # Wait for a free connection instead of failing while all are in use
+        if not slots.acquire(timeout=DB_POOL_WAIT_TIMEOUT):
+            self._mark_pool_exhausted()
+            raise psycopg2.pool.PoolError("connection pool exhausted")
+        try:
+            conn = pool.getconn()
+        except Exception as e:
+            slots.release()
+            if isinstance(e, psycopg2.pool.PoolError):
+                self._mark_pool_exhausted()
+            raise
+        
+        broken = False
+        try:
+            with conn.cursor(name=name, cursor_factory=cursor_factory) as cursor:
+                yield cursor
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            # putconn raises PoolError if the pool was closed (reload_dsn) while
+            # the connection was out; the slot must be returned regardless
+            try:
+                pool.putconn(conn, close=broken or bool(conn.closed))
+            finally:
+                slots.release()
+        
+    @staticmethod
+    def _mark_pool_exhausted() -> None:
+        """Flag the current request so that it is answered with a 503."""
+        if has_request_context():
+            g.db_pool_exhausted = True
+        
+    @staticmethod
+    def _pool_exhausted_response() -> Response:
+        """Build the 503 response for requests that found the pool exhausted."""
+        logger.warning(f"Database connection pool exhausted for {request.path}")
+        message = "The database is busy, please retry shortly"
+        if request.path.startswith("/api/"):
+            response = jsonify({"error": message})
+        else:
+            response = Response(message, mimetype="text/plain")
+        response.status_code = 503
+        response.headers["Retry-After"] = "5"
+        return response
+        
+    @staticmethod
+    def _build_db_connection_string() -> str:
         """Build database connection string from environment variables."""
         host = os.environ.get("POSTGRES_HOST", "localhost")
         port = os.environ.get("POSTGRES_PORT", "5432")
@@ -133,6 +648,20 @@ class JobScraperWebApp:
         
         return f"postgresql://{user}:{password}@{host}:{port}/{db}"
         
+    def _build_url_for_map(self) -> Dict[str, bool]:
+        """Build the map of endpoint names available to templates."""
+        url_for_map = {}
+        for rule in self.app.url_map.iter_rules():
+            # Store full endpoint name including blueprint prefix
+            url_for_map[rule.endpoint] = True
+            
+            # For blueprint endpoints, also store without the blueprint prefix
+            # This makes templates more resilient to blueprint refactoring
+            if '.' in rule.endpoint:
+                url_for_map[rule.endpoint.rsplit('.', 1)[-1]] = True
+        
+        return url_for_map
+        
     def _register_routes(self) -> None:
         """Register application routes."""
         # Dashboard routes
@@ -157,6 +686,7 @@ class JobScraperWebApp:
         # API routes
         self.app.route('/api/jobs', methods=['GET'])(self.api_get_jobs)
         self.app.route('/api/stats', methods=['GET'])(self.api_get_stats)
+        self.app.route('/api/jobs/count', methods=['GET'])(api_auth_required(self.api_get_job_count))
         self.app.route('/api/job/<job_id>', methods=['GET'])(self.api_get_job)
         
         # Search routes
@@ -174,16 +704,16 @@ class JobScraperWebApp:
         """Initialize database and data managers synchronously."""
         if not self.db_manager:
             # Create database manager
-            db_conn_string = self._build_db_connection_string()
+            db_conn_string = self.db_connection_string
             
-            # Use psycopg2 for direct connection
+            # Open and warm the connection pool; this doubles as the
+            # connectivity check, so no separate test connection is made
             try:
-                # Test the connection
-                conn = psycopg2.connect(db_conn_string)
-                conn.close()
+                self.warm_db_pool()
                 logger.info("Database connection successful")
             except Exception as e:
-                logger.error(f"Database connection failed: {e}")
+                logger.error(f"Error connecting to database: {str(e)}")
+                DB_CONN_ERRORS.inc()
             
             # Create database manager without initialization
             self.db_manager = DatabaseManager(
@@ -199,9 +729,51 @@ class JobScraperWebApp:
         
         # Register custom template filters
         register_filters(self.app)
+        
+        # Keep the TOTAL_JOBS gauge updated outside the request path
+        self._start_job_count_refresher()
+        
+    def _estimate_job_count(self, cursor) -> int:
+        """
+        Return the number of jobs from the planner's row estimate.
+        
+        Falls back to an exact COUNT(*) when the table has never been analyzed.
+        """
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            (f"{self.db_manager.schema}.jobs",)
+        )
+        result = cursor.fetchone()
+        if result and result[0] < 0:
+            cursor.execute(f"SELECT COUNT(*) FROM {self.db_manager.schema}.jobs")
+            result = cursor.fetchone()
+        return result[0] if result else 0
+        
+    def _start_job_count_refresher(self) -> None:
+        """Start the background thread that refreshes the TOTAL_JOBS gauge."""
+        if self._job_count_thread is not None:
+            return
+        
+        def refresh_job_count():
+            while True:
+                try:
+                    with self._cursor(cursor_factory=None) as cursor:
+                        TOTAL_JOBS.set(self._estimate_job_count(cursor))
+                except Exception as e:
+                    logger.error(f"Error refreshing job count metric: {e}")
+                time.sleep(JOB_COUNT_REFRESH_INTERVAL)
+        
+        self._job_count_thread = threading.Thread(target=refresh_job_count)
+        self._job_count_thread.daemon = True
+        self._job_count_thread.start()
     
     def run(self, host: str = "0.0.0.0", port: int = 5000, debug: bool = False) -> None:
-        """Run the Flask application."""
+        """
+        Run the Flask development server.
+
+        Only meant for local development; production deployments serve
+        ``create_app()`` through gunicorn (see ``gunicorn.conf.py``).
+        """
         # Initialize components in a synchronous context
         self._initialize_managers_sync()
         
@@ -230,20 +802,13 @@ class JobScraperWebApp:
         job_count = 0
         if self.db_manager:
             try:
-                # Use direct database connection
-                conn = psycopg2.connect(self._build_db_connection_string())
-                cursor = conn.cursor()
-                cursor.execute(f"SELECT COUNT(*) FROM {self.db_manager.schema}.jobs")
-                result = cursor.fetchone()
-                if result:
-                    job_count = result[0]
-                    # Update Prometheus metric
-                    TOTAL_JOBS.set(job_count)
-                cursor.close()
-                conn.close()
+                with self._cursor(cursor_factory=None) as cursor:
+                    # Use the planner's row estimate instead of scanning the table;
+                    # the exact count is available from /api/jobs/count
+                    job_count = self._estimate_job_count(cursor)
             except Exception as e:
                 logger.error(f"Error getting job count: {e}")
-                ERRORS.labels(type="database").inc()
+                DB_ERRORS.inc()
         
         # Get scraper stats
         scraper_stats = {
@@ -256,17 +821,14 @@ class JobScraperWebApp:
         recent_jobs = []
         if self.db_manager:
             try:
-                conn = psycopg2.connect(self._build_db_connection_string())
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-                cursor.execute(f"""
-                    SELECT id, title, company_name_en, activation_time, url
-                    FROM {self.db_manager.schema}.jobs
-                    ORDER BY activation_time DESC
-                    LIMIT 10
-                """)
-                recent_jobs = [dict(row) for row in cursor.fetchall()]
-                cursor.close()
-                conn.close()
+                with self._cursor() as cursor:
+                    cursor.execute(f"""
+                        SELECT id, title, company_name_en, activation_time, url
+                        FROM {self.db_manager.schema}.jobs
+                        ORDER BY activation_time DESC NULLS LAST
+                        LIMIT 10
+                    """)
+                    recent_jobs = [dict(row) for row in cursor.fetchall()]
             except Exception as e:
                 logger.error(f"Error getting recent jobs: {e}")
         
@@ -313,27 +875,28 @@ class JobScraperWebApp:
                     results = scraper.run()
                     duration = time.time() - start_time
                     
-                    # Update metrics
-                    if results.get("new_jobs", 0) > 0:
-                        NEW_JOBS.inc(results.get("new_jobs", 0))
-                    
-                    if results.get("errors", 0) > 0:
-                        ERRORS.labels(type="scraping").inc(results.get("errors", 0))
-                    
-                    if results.get("retries", 0) > 0:
-                        RETRIES.inc(results.get("retries", 0))
+                    # Update metrics once per run
+                    new_jobs = results.get("new_jobs", 0)
+                    errors = results.get("errors", 0)
+                    retries = results.get("retries", 0)
+                    if new_jobs > 0:
+                        NEW_JOBS.inc(new_jobs)
+                    if errors > 0:
+                        SCRAPING_ERRORS.inc(errors)
+                    if retries > 0:
+                        RETRIES.inc(retries)
                     
                     # Update scraper stats
                     self.scraper_stats.update({
                         "total_jobs": results.get("total_jobs", 0),
-                        "new_jobs": results.get("new_jobs", 0),
+                        "new_jobs": new_jobs,
                         "failed_jobs": results.get("failed_jobs", 0),
                         "duration": duration,
                         "status": "completed"
                     })
                 except Exception as e:
                     logger.error(f"Error in scraper: {str(e)}")
-                    ERRORS.labels(type="scraper_thread").inc()
+                    SCRAPER_THREAD_ERRORS.inc()
                     self.scraper_stats["status"] = "error"
                     self.scraper_stats["error"] = str(e)
                 finally:
@@ -348,7 +911,7 @@ class JobScraperWebApp:
             return redirect(url_for('dashboard'))
         except Exception as e:
             logger.error(f"Error starting scraper: {str(e)}")
-            ERRORS.labels(type="scraper_start").inc()
+            SCRAPER_START_ERRORS.inc()
             flash(f"Error starting scraper: {str(e)}", "danger")
         return redirect(url_for('dashboard'))
         
@@ -390,14 +953,11 @@ class JobScraperWebApp:
             if request.form.get('keywords'):
                 filters['keywords'] = request.form.get('keywords')
             
+            if format_type not in ('json', 'csv', 'parquet'):
+                flash(f"Unsupported export format: {format_type}", "danger")
+                return redirect(url_for('export_data'))
+            
             try:
-                # Get filtered jobs using our synchronous method
-                jobs = self._get_filtered_jobs(filters, limit=limit)
-                
-                if not jobs:
-                    flash("No jobs found matching the filters", "warning")
-                    return redirect(url_for('export_data'))
-                
                 # Create a timestamp for the filename
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"job_export_{timestamp}.{format_type}"
@@ -407,30 +967,63 @@ class JobScraperWebApp:
                 export_dir.mkdir(exist_ok=True, parents=True)
                 output_file = export_dir / filename
                 
-                # Export the data based on format type
-                if format_type == 'json':
-                    with open(output_file, 'w') as f:
-                        json.dump(jobs, f, default=str, indent=2)
-                elif format_type == 'csv':
+                # Export the data based on format type. Columnar formats are
+                # read straight into Arrow when connectorx is available,
+                # skipping per-row Python objects
+                table = None
+                if cx is not None and format_type in ('csv', 'parquet'):
+                    table = self._get_filtered_jobs_arrow(filters, limit=limit)
+                
+                if table is not None:
+                    if format_type == 'csv':
+                        import pyarrow.csv as pa_csv
+                        pa_csv.write_csv(table, str(output_file))
+                    else:
+                        import pyarrow.parquet as pq
+                        pq.write_table(table, str(output_file), compression='zstd')
+                    job_count = table.num_rows
+                elif format_type == 'parquet':
+                    import pandas as pd
+                    jobs = self._get_filtered_jobs(filters, limit=limit)
                     df = pd.DataFrame(jobs)
-                    df.to_csv(output_file, index=False)
+                    df.to_parquet(output_file, index=False, compression='zstd')
+                    job_count = len(jobs)
                 else:
-                    flash(f"Unsupported export format: {format_type}", "danger")
+                    # Row formats are written as rows arrive from the server-side cursor
+                    job_count = self._write_jobs_stream(
+                        self._iter_filtered_jobs(filters, limit=limit),
+                        format_type,
+                        output_file
+                    )
+                
+                if not job_count:
+                    output_file.unlink(missing_ok=True)
+                    flash("No jobs found matching the filters", "warning")
                     return redirect(url_for('export_data'))
                 
-                logger.info(f"Exported {len(jobs)} jobs to {output_file}")
+                logger.info(f"Exported {job_count} jobs to {output_file}")
                 
                 # Compress if requested
                 if compress:
-                    zip_filename = f"{filename}.zip"
-                    zip_path = export_dir / zip_filename
-                    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                        zipf.write(output_file, arcname=filename)
+                    if zstandard is not None:
+                        # Multi-threaded zstd is much faster than deflate at a similar ratio
+                        compressed_filename = f"{filename}.zst"
+                        compressed_path = export_dir / compressed_filename
+                        cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+                        with open(output_file, 'rb') as src, \
+                                open(compressed_path, 'wb') as out, \
+                                cctx.stream_writer(out) as writer:
+                            shutil.copyfileobj(src, writer, COPY_BUFFER_SIZE)
+                    else:
+                        compressed_filename = f"{filename}.zip"
+                        compressed_path = export_dir / compressed_filename
+                        with zipfile.ZipFile(compressed_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                            zipf.write(output_file, arcname=filename)
                     
                     # Remove the original file
                     output_file.unlink()
-                    output_file = zip_path
-                    filename = zip_filename
+                    output_file = compressed_path
+                    filename = compressed_filename
                 
                 flash(f"Data exported successfully: {filename}", "success")
                 return redirect(url_for('download_file', filename=filename))
@@ -460,10 +1053,35 @@ class JobScraperWebApp:
             update_existing = 'update_existing' in request.form
             batch_size = request.form.get('batch_size', type=int, default=1000)
             
-            # Save uploaded file
-            filename = secure_filename(file.filename)
-            file_path = os.path.join(self.app.config['UPLOAD_FOLDER'], filename)
-            file.save(file_path)
+            # Stream the upload to a temporary file and checksum it in the same
+            # pass; it only replaces UPLOAD_FOLDER/<filename> if it is imported
+            filename = _fast_secure(file.filename)
+            upload_dir = self.app.config['UPLOAD_FOLDER']
+            file_path = os.path.join(upload_dir, filename)
+            hasher = checksum_hasher()
+            fd, tmp_path = tempfile.mkstemp(dir=upload_dir, suffix=".part")
+            try:
+                with os.fdopen(fd, 'wb') as out:
+                    while chunk := file.stream.read(COPY_BUFFER_SIZE):
+                        out.write(chunk)
+                        hasher.update(chunk)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            checksum = hasher.hexdigest()
+            
+            # Skip files whose exact contents were already imported. Digests
+            # are only comparable when made with the same algorithm
+            previous = self._load_import_index().get(checksum)
+            if previous and previous.get("algorithm") == CHECKSUM_ALGORITHM:
+                os.unlink(tmp_path)
+                logger.info(f"Skipping {filename}: already imported as {previous['filename']}")
+                flash(
+                    f"File already imported as {previous['filename']} on {previous['imported_at']}",
+                    "info"
+                )
+                return redirect(url_for('dashboard'))
+            os.replace(tmp_path, file_path)
             
             # Determine format type from extension
             format_type = None
@@ -485,9 +1103,11 @@ class JobScraperWebApp:
                         with open(file_path, 'r') as f:
                             data = json.load(f)
                     elif format_type == 'csv':
+                        import pandas as pd
                         df = pd.read_csv(file_path)
                         data = df.to_dict('records')
                     elif format_type == 'parquet':
+                        import pandas as pd
                         df = pd.read_parquet(file_path)
                         data = df.to_dict('records')
                     else:
@@ -500,6 +1120,7 @@ class JobScraperWebApp:
                     # For now, we'll just simulate success since we don't have 
                     # a synchronous import method to the database
                     success_count = len(data)
+                    self._record_import(checksum, filename, success_count)
                 
                 except Exception as e:
                     logger.error(f"Error loading file: {e}")
@@ -518,21 +1139,63 @@ class JobScraperWebApp:
         # GET request - show import form
         return render_template('import.html')
         
+    def _load_import_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the checksum index of previously imported files."""
+        index_file = self.data_dir / "imported_files.json"
+        if not index_file.exists():
+            return {}
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.error(f"Error reading import index: {e}")
+            return {}
+    
+    def _record_import(self, checksum: str, filename: str, record_count: int) -> None:
+        """Add an imported file's checksum to the import index."""
+        index = self._load_import_index()
+        index[checksum] = {
+            "algorithm": CHECKSUM_ALGORITHM,
+            "filename": filename,
+            "records": record_count,
+            "imported_at": datetime.now().isoformat()
+        }
+        try:
+            with open(self.data_dir / "imported_files.json", 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2)
+        except OSError as e:
+            logger.error(f"Error writing import index: {e}")
+        
     def download_file(self, filename):
         """Download a file."""
-        # Check if file is in data_dir
-        file_path = self.data_dir / filename
-        if not file_path.exists():
-            # Check if file is in backup_dir
-            file_path = self.backup_dir / filename
-            if not file_path.exists():
-                flash(f"File not found: {filename}", "danger")
-                return redirect(url_for('dashboard'))
+        # Look for the file in the data, exports and backup directories.
+        # The prefixes match the internal nginx locations used with X-Accel-Redirect.
+        download_roots = [
+            ("data", self.data_dir),
+            ("data/exports", self.data_dir / "exports"),
+            ("backups", self.backup_dir),
+        ]
+        for prefix, root in download_roots:
+            file_path = root / filename
+            if file_path.is_file() and root.resolve() in file_path.resolve().parents:
+                break
+        else:
+            flash(f"File not found: {filename}", "danger")
+            return redirect(url_for('dashboard'))
+        
+        if self.use_xaccel:
+            # Let nginx send the file with sendfile(2) instead of streaming it
+            # through the worker
+            return Response(headers={
+                "X-Accel-Redirect": f"/protected_downloads/{prefix}/{quote(filename)}",
+                "Content-Type": "application/octet-stream",
+                "Content-Disposition": f'attachment; filename="{file_path.name}"'
+            })
                 
         return send_file(
             str(file_path),
             as_attachment=True,
-            download_name=filename
+            download_name=file_path.name
         )
         
     def create_backup(self):
@@ -569,65 +1232,73 @@ class JobScraperWebApp:
                         if exports_dir.exists():
                             for file_path in exports_dir.glob('*'):
                                 if file_path.is_file():
-                                    # Add file to the backup
-                                    zipf.write(
-                                        file_path, 
+                                    # Exports are already compressed, so store them
+                                    # as-is and copy in large chunks
+                                    export_info = zipfile.ZipInfo.from_file(
+                                        file_path,
                                         arcname=f"exports/{file_path.name}"
                                     )
+                                    export_info.compress_type = zipfile.ZIP_STORED
+                                    with open(file_path, 'rb') as src, \
+                                            zipf.open(export_info, 'w', force_zip64=True) as dst:
+                                        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
                     
-                    # Create a database dump
+                    # Stream a custom-format database dump straight into the archive
                     try:
-                        # Create a temporary file for the database dump
-                        db_dump_file = self.data_dir / f"db_dump_{timestamp}.sql"
-                        
                         # Get database connection details
-                        db_config = self.config_manager.database_config
                         host = os.environ.get("POSTGRES_HOST", "localhost")
                         port = os.environ.get("POSTGRES_PORT", "5432")
                         dbname = os.environ.get("POSTGRES_DB", "jobsdb")
                         user = os.environ.get("POSTGRES_USER", "jobuser")
                         password = os.environ.get("POSTGRES_PASSWORD", "devpassword")
                         
-                        # Use pg_dump to create a SQL dump
-                        import subprocess
+                        # Custom format is already compressed by pg_dump and can be
+                        # restored with pg_restore
                         dump_cmd = [
                             "pg_dump",
                             f"--host={host}",
                             f"--port={port}",
                             f"--username={user}",
                             f"--dbname={dbname}",
-                            "--format=plain",
-                            "--schema=public",
-                            "--file", str(db_dump_file)
+                            "--format=custom",
+                            "--schema=public"
                         ]
                         
                         # Set PGPASSWORD environment variable for authentication
                         env = os.environ.copy()
                         env["PGPASSWORD"] = password
                         
-                        # Execute pg_dump
-                        logger.info(f"Creating database dump: {' '.join(dump_cmd)}")
-                        process = subprocess.run(
-                            dump_cmd,
-                            env=env,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            check=False
+                        # Store the dump without recompressing it
+                        dump_info = zipfile.ZipInfo(
+                            "database/db_dump.dump",
+                            date_time=time.localtime()[:6]
                         )
+                        dump_info.compress_type = zipfile.ZIP_STORED
+                        
+                        logger.info(f"Creating database dump: {' '.join(dump_cmd)}")
+                        # The dump streams straight into the archive, so a failed
+                        # pg_dump leaves a partial entry; dump_error.log is written
+                        # next to it and restore_backup refuses such archives
+                        with tempfile.TemporaryFile() as err_file:
+                            process = subprocess.Popen(
+                                dump_cmd,
+                                env=env,
+                                stdout=subprocess.PIPE,
+                                stderr=err_file
+                            )
+                            try:
+                                with zipf.open(dump_info, 'w', force_zip64=True) as dump_entry:
+                                    shutil.copyfileobj(process.stdout, dump_entry, COPY_BUFFER_SIZE)
+                            finally:
+                                process.stdout.close()
+                                returncode = process.wait()
+                            err_file.seek(0)
+                            error_msg = err_file.read().decode('utf-8', errors='replace')
                         
-                        if process.returncode == 0:
-                            # Add dump file to the zip
-                            if db_dump_file.exists():
-                                zipf.write(
-                                    db_dump_file,
-                                    arcname="database/db_dump.sql"
-                                )
-                                # Remove the temporary dump file
-                                db_dump_file.unlink()
-                                logger.info("Database dump added to backup")
+                        if returncode == 0:
+                            logger.info("Database dump added to backup")
                         else:
                             # Log the error but continue with the backup
-                            error_msg = process.stderr.decode('utf-8')
                             logger.error(f"Failed to create database dump: {error_msg}")
                             # Add error log to the backup
                             zipf.writestr("database/dump_error.log", error_msg)
@@ -674,22 +1345,28 @@ class JobScraperWebApp:
                     return redirect(url_for('backups'))
                 
                 # Create a temporary directory for extraction
-                import tempfile
-                import shutil
                 temp_dir = Path(tempfile.mkdtemp())
                 
                 try:
-                    # Extract the backup
-                    with zipfile.ZipFile(backup_path, 'r') as zipf:
-                        # Check if password-protected
-                        if zipf.testzip() and password:
-                            # This is a placeholder as Python's zipfile doesn't support passwords
-                            # In a real implementation, use a library that supports password-protected ZIPs
-                            flash("Password-protected zip files are not supported", "danger")
-                            return redirect(url_for('backups'))
+                    # Extract the backup, reading the archive through a large buffer
+                    with open(backup_path, 'rb', buffering=COPY_BUFFER_SIZE) as backup_fileobj, \
+                            zipfile.ZipFile(backup_fileobj, 'r') as zipf:
+                        # Check the encryption flag in the central directory instead
+                        # of decompressing every entry; extraction verifies CRCs anyway
+                        is_encrypted = any(info.flag_bits & 0x1 for info in zipf.infolist())
+                        if is_encrypted:
+                            if not password:
+                                flash("This backup is password-protected; please provide the password", "danger")
+                                return redirect(url_for('backups'))
+                            zipf.setpassword(password.encode())
                         
-                        # Extract all files
-                        zipf.extractall(temp_dir)
+                        # Extract only the parts that are being restored
+                        prefixes = []
+                        if restore_db:
+                            prefixes.append("database/")
+                        if restore_files:
+                            prefixes.append("exports/")
+                        _extract_zip_members(zipf, temp_dir, ["metadata.json"], prefixes)
                         
                         # Check for metadata
                         metadata_path = temp_dir / "metadata.json"
@@ -699,9 +1376,15 @@ class JobScraperWebApp:
                                 logger.info(f"Backup metadata: {metadata}")
                         
                         # Restore database if requested
-                        if restore_db:
-                            db_dump_path = temp_dir / "database" / "db_dump.sql"
-                            if db_dump_path.exists():
+                        if restore_db and (temp_dir / "database" / "dump_error.log").exists():
+                            # The dump failed when this backup was taken, so any dump
+                            # file next to the error log cannot be trusted
+                            logger.error(f"Backup {backup_file} has no usable database dump")
+                            flash("The database dump in this backup failed; the database was not restored", "danger")
+                        elif restore_db:
+                            custom_dump_path = temp_dir / "database" / "db_dump.dump"
+                            plain_dump_path = temp_dir / "database" / "db_dump.sql"
+                            if custom_dump_path.exists() or plain_dump_path.exists():
                                 # Get database connection details
                                 host = os.environ.get("POSTGRES_HOST", "localhost")
                                 port = os.environ.get("POSTGRES_PORT", "5432")
@@ -709,37 +1392,58 @@ class JobScraperWebApp:
                                 user = os.environ.get("POSTGRES_USER", "jobuser")
                                 password = os.environ.get("POSTGRES_PASSWORD", "devpassword")
                                 
-                                # Use psql to restore the database
-                                import subprocess
-                                restore_cmd = [
-                                    "psql",
-                                    f"--host={host}",
-                                    f"--port={port}",
-                                    f"--username={user}",
-                                    f"--dbname={dbname}",
-                                    "-f", str(db_dump_path)
-                                ]
+                                if custom_dump_path.exists():
+                                    # Custom-format dumps are restored with pg_restore,
+                                    # loading tables and building indexes in parallel
+                                    restore_cmd = [
+                                        "pg_restore",
+                                        f"--host={host}",
+                                        f"--port={port}",
+                                        f"--username={user}",
+                                        f"--dbname={dbname}",
+                                        f"--jobs={os.cpu_count() or 1}",
+                                        "--no-owner",
+                                        str(custom_dump_path)
+                                    ]
+                                else:
+                                    # Older backups contain a plain SQL dump
+                                    restore_cmd = [
+                                        "psql",
+                                        f"--host={host}",
+                                        f"--port={port}",
+                                        f"--username={user}",
+                                        f"--dbname={dbname}",
+                                        "-f", str(plain_dump_path)
+                                    ]
                                 
                                 # Set PGPASSWORD environment variable for authentication
                                 env = os.environ.copy()
                                 env["PGPASSWORD"] = password
+                                # The load can be replayed from the backup, so skip waiting on WAL flushes
+                                env["PGOPTIONS"] = "-c synchronous_commit=off"
                                 
-                                # Execute psql
+                                # Execute the restore
                                 logger.info(f"Restoring database: {' '.join(restore_cmd)}")
-                                process = subprocess.run(
-                                    restore_cmd,
-                                    env=env,
-                                    stdout=subprocess.PIPE,
-                                    stderr=subprocess.PIPE,
-                                    check=False
-                                )
-                                
-                                if process.returncode == 0:
-                                    logger.info("Database restored successfully")
-                                else:
-                                    error_msg = process.stderr.decode('utf-8')
-                                    logger.error(f"Failed to restore database: {error_msg}")
-                                    flash(f"Database restore failed: {error_msg}", "danger")
+                                # psql echoes every statement, so discard stdout and keep
+                                # stderr on disk rather than in memory
+                                with tempfile.TemporaryFile() as err_file:
+                                    process = subprocess.run(
+                                        restore_cmd,
+                                        env=env,
+                                        stdout=subprocess.DEVNULL,
+                                        stderr=err_file,
+                                        check=False
+                                    )
+                                    
+                                    if process.returncode == 0:
+                                        logger.info("Database restored successfully")
+                                    else:
+                                        # Only the end of the output is useful for diagnosis
+                                        err_file.seek(0, os.SEEK_END)
+                                        err_file.seek(max(0, err_file.tell() - RESTORE_ERROR_TAIL_BYTES))
+                                        error_msg = err_file.read().decode('utf-8', errors='replace')
+                                        logger.error(f"Failed to restore database: {error_msg}")
+                                        flash(f"Database restore failed: {error_msg[-1000:]}", "danger")
                             else:
                                 logger.warning("No database dump found in the backup")
                                 flash("No database dump found in the backup", "warning")
@@ -752,13 +1456,17 @@ class JobScraperWebApp:
                                 dest_dir = self.data_dir / "exports"
                                 dest_dir.mkdir(exist_ok=True, parents=True)
                                 
-                                # Copy files
-                                file_count = 0
-                                for file_path in exports_dir.glob('*'):
-                                    if file_path.is_file():
-                                        dest_file = dest_dir / file_path.name
-                                        shutil.copy2(file_path, dest_file)
-                                        file_count += 1
+                                # Copy files concurrently; the copies run in the kernel
+                                # without holding the GIL
+                                export_files = [fp for fp in exports_dir.glob('*') if fp.is_file()]
+                                with ThreadPoolExecutor(max_workers=RESTORE_COPY_WORKERS) as executor:
+                                    futures = [
+                                        executor.submit(_copy_file, file_path, dest_dir / file_path.name)
+                                        for file_path in export_files
+                                    ]
+                                    for future in futures:
+                                        future.result()
+                                file_count = len(futures)
                                 
                                 logger.info(f"Restored {file_count} files")
                                 flash(f"Restored {file_count} files", "success")
@@ -818,23 +1526,108 @@ class JobScraperWebApp:
             filters['date_to'] = date_to
         if keywords:
             filters['keywords'] = keywords
+        
+        # Keyset position from a previous response's next_cursor
+        after = _parse_keyset_cursor(request.args.get('after_time'), request.args.get('after_id'))
+        if after:
+            filters['after'] = after
             
         try:
-            # Use the synchronous version directly
-            jobs = self._get_filtered_jobs(filters, limit, offset)
+            columns, rows = self._get_filtered_job_rows(filters, limit, offset)
+            
+            next_cursor = None
+            if rows and limit:
+                last = dict(zip(columns, rows[-1]))
+                next_cursor = {
+                    "after_time": last['activation_time'].isoformat() if last['activation_time'] else None,
+                    "after_id": last['id']
+                }
             
-            return jsonify({
-                "total": len(jobs),
+            # Rows are sent as arrays alongside a single column list instead
+            # of one object per job; clients zip them back together.
+            payload = orjson.dumps({
+                "total": len(rows),
                 "offset": offset,
                 "limit": limit,
-                "jobs": jobs
-            })
+                "next_cursor": next_cursor,
+                "columns": columns,
+                "rows": rows
+            }, default=str)
+            return Response(payload, mimetype='application/json')
         except Exception as e:
             logger.error(f"Error in API get_jobs: {e}")
             return jsonify({
                 "error": str(e)
             }), 500
             
+    def _build_filtered_jobs_query(
+        self,
+        filters: Dict[str, Any],
+        limit: int = 100,
+        offset: int = 0
+    ) -> Tuple[str, List]:
+        """
+        Build the query used to list jobs matching export/API filters.
+        
+        Args:
+            filters: Filter values (date_from, date_to, keywords, and
+                after, an (activation_time, id) keyset position)
+            limit: Maximum number of rows; 0 returns all matching rows
+            offset: Number of rows to skip
+            
+        Returns:
+            Tuple of query string and query parameters
+        """
+        # Build WHERE clause
+        where_clauses = []
+        params = []
+        
+        if filters.get('date_from'):
+            where_clauses.append("activation_time >= %s")
+            params.append(filters['date_from'])
+            
+        if filters.get('date_to'):
+            where_clauses.append("activation_time <= %s")
+            params.append(filters['date_to'])
+            
+        if filters.get('keywords'):
+            # Only search in title field since description might not exist
+            where_clauses.append("title ILIKE %s")
+            keyword_param = f"%{filters['keywords']}%"
+            params.append(keyword_param)
+        
+        # Keyset pagination: continue after the previous page's last
+        # (activation_time, id) instead of skipping rows with OFFSET. Jobs
+        # without an activation_time come last, ordered by id alone
+        if filters.get('after'):
+            after_time, after_id = filters['after']
+            if after_time is None:
+                where_clauses.append("activation_time IS NULL AND id < %s")
+                params.append(after_id)
+            else:
+                where_clauses.append("((activation_time, id) < (%s, %s) OR activation_time IS NULL)")
+                params.extend([after_time, after_id])
+            offset = 0
+            
+        # Build query
+        where_clause = " AND ".join(where_clauses) if where_clauses else "TRUE"
+        query = f"""
+        SELECT id, title, company_name_en, activation_time, url, salary,
+               locations
+        FROM {self.db_manager.schema}.jobs
+        WHERE {where_clause}
+        ORDER BY activation_time DESC NULLS LAST, id DESC
+        """
+        # Bound as parameters so the query text is the same for every page
+        if limit:
+            query += "LIMIT %s OFFSET %s"
+            params.extend([limit, offset])
+        elif offset:
+            query += "OFFSET %s"
+            params.append(offset)
+        
+        return query, params
+            
     def _get_filtered_jobs(
         self, 
         filters: Dict[str, Any], 
@@ -846,52 +1639,127 @@ class JobScraperWebApp:
             return []
             
         try:
-            # Create a new connection
-            conn = psycopg2.connect(self._build_db_connection_string())
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+            query, params = self._build_filtered_jobs_query(filters, limit, offset)
+            with self._cursor() as cursor:
+                cursor.execute(query, params)
+                return [dict(row) for row in cursor.fetchall()]
+                
+        except Exception as e:
+            logger.error(f"Error getting filtered jobs: {e}")
+            return []
             
-            # Build WHERE clause
-            where_clauses = []
-            params = []
+    def _get_filtered_job_rows(
+        self,
+        filters: Dict[str, Any],
+        limit: int = 100,
+        offset: int = 0
+    ) -> Tuple[List[str], List[tuple]]:
+        """
+        Get filtered jobs as column names plus plain row tuples.
+        
+        Unlike _get_filtered_jobs this skips building a dict per row and
+        lets errors propagate to the caller.
+        """
+        if not self.db_manager:
+            return [], []
+        
+        query, params = self._build_filtered_jobs_query(filters, limit, offset)
+        with self._cursor(cursor_factory=None) as cursor:
+            cursor.execute(query, params)
+            columns = [column[0] for column in cursor.description]
+            return columns, cursor.fetchall()
             
-            if filters.get('date_from'):
-                where_clauses.append("activation_time >= %s")
-                params.append(filters['date_from'])
-                
-            if filters.get('date_to'):
-                where_clauses.append("activation_time <= %s")
-                params.append(filters['date_to'])
-                
-            if filters.get('keywords'):
-                # Only search in title field since description might not exist
-                where_clauses.append("title ILIKE %s")
-                keyword_param = f"%{filters['keywords']}%"
-                params.append(keyword_param)
-                
-            # Build query
-            where_clause = " AND ".join(where_clauses) if where_clauses else "TRUE"
-            query = f"""
-            SELECT id, title, company_name_en, activation_time, url, salary,
-                   locations
-            FROM {self.db_manager.schema}.jobs
-            WHERE {where_clause}
-            ORDER BY activation_time DESC
-            LIMIT {limit} OFFSET {offset}
-            """
-            
-            # Execute query
+    def _iter_filtered_jobs(
+        self,
+        filters: Dict[str, Any],
+        limit: int = 0,
+        offset: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield filtered jobs from a server-side cursor.
+        
+        Rows are fetched EXPORT_FETCH_SIZE at a time, so memory use does not
+        grow with the size of the result.
+        """
+        if not self.db_manager:
+            return
+        
+        query, params = self._build_filtered_jobs_query(filters, limit, offset)
+        
+        with self._cursor(
+            cursor_factory=psycopg2.extras.RealDictCursor,
+            name='export_cursor'
+        ) as cursor:
+            cursor.itersize = EXPORT_FETCH_SIZE
             cursor.execute(query, params)
-            rows = cursor.fetchall()
+            yield from cursor
             
-            # Clean up
-            cursor.close()
-            conn.close()
+    def _write_jobs_stream(
+        self,
+        jobs: Iterable[Dict[str, Any]],
+        format_type: str,
+        output_file: Path
+    ) -> int:
+        """
+        Write jobs to a JSON or CSV file one row at a time.
+        
+        Args:
+            jobs: Iterable of job rows
+            format_type: 'json' or 'csv'
+            output_file: Destination file
             
-            return [dict(row) for row in rows]
-                
+        Returns:
+            Number of rows written
+        """
+        count = 0
+        if format_type == 'json':
+            with open(output_file, 'wb') as f:
+                f.write(b'[')
+                for job in jobs:
+                    f.write(b',\n  ' if count else b'\n  ')
+                    f.write(orjson.dumps(job, default=str))
+                    count += 1
+                f.write(b'\n]\n' if count else b']\n')
+        else:
+            with open(output_file, 'w', newline='', encoding='utf-8') as f:
+                writer = None
+                for job in jobs:
+                    if writer is None:
+                        writer = csv.DictWriter(f, fieldnames=list(job.keys()))
+                        writer.writeheader()
+                    writer.writerow(job)
+                    count += 1
+        return count
+            
+    def _get_filtered_jobs_arrow(
+        self,
+        filters: Dict[str, Any],
+        limit: int = 0
+    ) -> Optional["pa.Table"]:
+        """
+        Get filtered jobs as an Arrow table using connectorx.
+        
+        connectorx does the type conversion in native code and does not take
+        query parameters, so the query is rendered with psycopg2's quoting first.
+        
+        Returns None when there is no database or connectorx fails, so that
+        the caller can fall back to the psycopg2 export.
+        """
+        if not self.db_manager:
+            return None
+        
+        query, params = self._build_filtered_jobs_query(filters, limit)
+        
+        with self._cursor(cursor_factory=None) as cursor:
+            sql = cursor.mogrify(query, params).decode(
+                psycopg2.extensions.encodings[cursor.connection.encoding]
+            )
+        
+        try:
+            return cx.read_sql(self._connectorx_url, sql, return_type='arrow')
         except Exception as e:
-            logger.error(f"Error getting filtered jobs: {e}")
-            return []
+            logger.warning(f"connectorx export failed, falling back to psycopg2: {e}")
+            return None
             
     def api_get_stats(self):
         """API endpoint to get job statistics."""
@@ -900,75 +1768,77 @@ class JobScraperWebApp:
             if not self.db_manager:
                 return jsonify({"error": "Database not connected"}), 500
             
-            # Create a new connection
-            conn = psycopg2.connect(self._build_db_connection_string())
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-            
-            # Get total job count
-            query = f"SELECT COUNT(*) FROM {self.db_manager.schema}.jobs"
-            cursor.execute(query)
-            total_jobs = cursor.fetchone()[0]
-            
-            # Get jobs by date (for last 30 days)
-            date_query = f"""
-                    SELECT 
-                DATE(activation_time) as job_date, 
-                COUNT(*) as job_count 
-            FROM {self.db_manager.schema}.jobs 
-            WHERE activation_time >= NOW() - INTERVAL '30 days'
-            GROUP BY job_date 
-            ORDER BY job_date DESC
-            """
-            cursor.execute(date_query)
-            date_rows = cursor.fetchall()
-            
-            # Get jobs by company
-            company_query = f"""
-                    SELECT 
-                COALESCE(company_name_en, company_name_fa, 'Unknown') as company, 
-                COUNT(*) as job_count 
-            FROM {self.db_manager.schema}.jobs 
-            GROUP BY company 
-            ORDER BY job_count DESC 
-                    LIMIT 10
-            """
-            cursor.execute(company_query)
-            company_rows = cursor.fetchall()
-            
-            # Get jobs by location
-            location_query = f"""
+            # The aggregates scan the whole table, so serve a recent result
+            cached = self._stats_cache
+            if cached["payload"] is not None and time.monotonic() - cached["ts"] < STATS_CACHE_TTL:
+                return jsonify(cached["payload"])
+            
+            with self._cursor() as cursor:
+                # Get total job count
+                query = f"SELECT COUNT(*) FROM {self.db_manager.schema}.jobs"
+                cursor.execute(query)
+                total_jobs = cursor.fetchone()[0]
+            
+                # Get jobs by date (for last 30 days)
+                date_query = f"""
                         SELECT 
-                json_extract_path_text(locations::json, '0', 'province', 'name') as location, 
-                COUNT(*) as job_count 
-            FROM {self.db_manager.schema}.jobs 
-            WHERE locations::text LIKE '%province%' 
-                        GROUP BY location
-            ORDER BY job_count DESC 
+                    activation_time::date as job_date, 
+                    COUNT(*) as job_count 
+                FROM {self.db_manager.schema}.jobs 
+                WHERE activation_time >= NOW() - INTERVAL '30 days'
+                GROUP BY 1 
+                ORDER BY 1 DESC
+                """
+                cursor.execute(date_query)
+                date_rows = cursor.fetchall()
+            
+                # Get jobs by company
+                company_query = f"""
+                        SELECT 
+                    COALESCE(company_name_en, company_name_fa, 'Unknown') as company, 
+                    COUNT(*) as job_count 
+                FROM {self.db_manager.schema}.jobs 
+                GROUP BY company 
+                ORDER BY job_count DESC 
                         LIMIT 10
-            """
-            
-            try:
-                cursor.execute(location_query)
-                location_rows = cursor.fetchall()
-            except Exception:
-                # Fallback if json extraction fails
-                location_rows = []
+                """
+                cursor.execute(company_query)
+                company_rows = cursor.fetchall()
+            
+                # Get jobs by location
+                # Read the province straight from the jsonb column (matches the
+                # jobs_province_idx expression index) instead of re-parsing it as text
+                location_query = f"""
+                            SELECT 
+                    locations->0->'province'->>'name' as location, 
+                    COUNT(*) as job_count 
+                FROM {self.db_manager.schema}.jobs 
+                WHERE locations->0->'province'->>'name' IS NOT NULL 
+                            GROUP BY 1
+                ORDER BY job_count DESC 
+                            LIMIT 10
+                """
             
-            # Close connection
-            cursor.close()
-            conn.close()
+                try:
+                    cursor.execute(location_query)
+                    location_rows = cursor.fetchall()
+                except Exception:
+                    # Fallback if json extraction fails
+                    location_rows = []
             
             # Format stats response
             jobs_by_date = {row['job_date'].strftime('%Y-%m-%d'): row['job_count'] for row in date_rows if row['job_date']}
             jobs_by_company = {row['company']: row['job_count'] for row in company_rows}
             jobs_by_location = {row['location']: row['job_count'] for row in location_rows if row['location']}
             
-            return jsonify({
+            payload = {
                 "total_jobs": total_jobs,
                 "jobs_by_date": jobs_by_date,
                 "jobs_by_company": jobs_by_company,
                 "jobs_by_location": jobs_by_location
-            })
+            }
+            self._stats_cache = {"ts": time.monotonic(), "payload": payload}
+            return jsonify(payload)
             
         except Exception as e:
             logger.error(f"Error in API get_stats: {e}")
@@ -980,6 +1850,22 @@ class JobScraperWebApp:
                 "jobs_by_location": {}
             }), 500
             
+    def api_get_job_count(self):
+        """API endpoint returning the exact number of jobs (admin only)."""
+        try:
+            if not self.db_manager:
+                return jsonify({"error": "Database not connected"}), 500
+            
+            with self._cursor(cursor_factory=None) as cursor:
+                cursor.execute(f"SELECT COUNT(*) FROM {self.db_manager.schema}.jobs")
+                total_jobs = cursor.fetchone()[0]
+            
+            return jsonify({"total_jobs": total_jobs})
+            
+        except Exception as e:
+            logger.error(f"Error in API get_job_count: {e}")
+            return jsonify({"error": str(e)}), 500
+            
     def api_get_job(self, job_id):
         """API endpoint to get a single job by ID."""
         try:
@@ -987,27 +1873,19 @@ class JobScraperWebApp:
             if not self.db_manager:
                 return jsonify({"error": "Database not connected"}), 500
                 
-            # Create a new connection
-            conn = psycopg2.connect(self._build_db_connection_string())
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-            
-            # Execute query
-            query = f"SELECT * FROM {self.db_manager.schema}.jobs WHERE id = %s"
-            cursor.execute(query, (job_id,))
-            row = cursor.fetchone()
-            
-            # Close connection
-            cursor.close()
-            conn.close()
+            with self._cursor(cursor_factory=None) as cursor:
+                # Let PostgreSQL build the JSON document; casting to text keeps
+                # psycopg2 from decoding it only for Flask to encode it again
+                query = f"SELECT row_to_json(j)::text FROM {self.db_manager.schema}.jobs j WHERE id = %s"
+                cursor.execute(query, (job_id,))
+                row = cursor.fetchone()
             
             if not row:
                 return jsonify({
                     "error": f"Job not found with ID: {job_id}"
                 }), 404
                 
-            # Convert row to dict
-            job_data = dict(row)
-            return jsonify(job_data)
+            return Response(row[0], mimetype='application/json')
             
         except Exception as e:
             logger.error(f"Error in API get_job: {e}")
@@ -1057,7 +1935,8 @@ class JobScraperWebApp:
             
             return redirect(url_for('scraper_config'))
         
-        # GET request - display current configuration
+        # GET request - display current configuration, picking up edits made on disk
+        self.config_manager.reload_if_changed()
         config = self.config_manager.scraper_config
         return render_template('scraper_config.html', config=config)
 
@@ -1072,47 +1951,43 @@ class JobScraperWebApp:
             sort = request.args.get('sort', 'date')
             page = int(request.args.get('page', 1))
             limit = int(request.args.get('limit', 25))
+            after = _parse_keyset_cursor(request.args.get('after_time'), request.args.get('after_id'))
             
             # Initialize empty results
             jobs = []
             total_jobs = 0
             total_pages = 1
+            next_cursor = None
             
             # Only perform search if we have a database connection
             if self.db_manager:
-                # Create connection
-                conn = psycopg2.connect(self._build_db_connection_string())
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+                with self._cursor() as cursor:
+                    # Build SQL query
+                    # Only the columns the results page renders
+                    query, params = self._build_search_query(
+                        keyword, location, company, days, sort, page, limit, after,
+                        columns=SEARCH_RESULT_COLUMNS
+                    )
                 
-                # Build SQL query
-                query, params, count_query, count_params = self._build_search_query(
-                    keyword, location, company, days, sort, page, limit
-                )
-                
-                # Execute count query
-                cursor.execute(count_query, count_params)
-                total_jobs = cursor.fetchone()[0]
-                
-                # Calculate pagination
-                total_pages = (total_jobs + limit - 1) // limit
-                
-                # Execute main query
-                if total_jobs > 0:
+                    # The page rows carry the total match count in _total,
+                    # so one query serves both the results and the pagination
                     cursor.execute(query, params)
                     jobs = [dict(row) for row in cursor.fetchall()]
-                    
-                    # Process JSON columns
-                    for job in jobs:
-                        for field in ['locations', 'work_types', 'tags', 'job_post_categories', 'salary']:
-                            if field in job and job[field] and isinstance(job[field], str):
-                                try:
-                                    job[field] = json.loads(job[field])
-                                except (json.JSONDecodeError, TypeError):
-                                    pass
+                    total_jobs = jobs[0]['_total'] if jobs else 0
+                    if after and sort == 'date':
+                        # A keyset page only counts the rows from its position on
+                        total_jobs += (page - 1) * limit
+                
+                    # Calculate pagination
+                    total_pages = (total_jobs + limit - 1) // limit
                 
-                # Close cursor and connection
-                cursor.close()
-                conn.close()
+                    for job in jobs:
+                        del job['_total']
+                    
+                    # The next page can continue from this page's last row
+                    if sort == 'date' and jobs:
+                        last_time = jobs[-1]['activation_time']
+                        next_cursor = (last_time.isoformat() if last_time else None, jobs[-1]['id'])
             else:
                 flash("Database connection not available", "error")
             
@@ -1131,7 +2006,12 @@ class JobScraperWebApp:
                 total_jobs=total_jobs,
                 page=page,
                 total_pages=total_pages,
-                limit=limit
+                limit=limit,
+                next_cursor=next_cursor,
+                page_args={
+                    key: value for key, value in request.args.items()
+                    if key not in ('page', 'after_time', 'after_id')
+                }
             )
             
         except Exception as e:
@@ -1141,109 +2021,73 @@ class JobScraperWebApp:
     
     def _build_search_query(
         self, keyword: str, location: str, company: str, days: str, 
-        sort: str, page: int, limit: int
-    ) -> Tuple[str, List, str, List]:
+        sort: str, page: int, limit: int,
+        after: Optional[Tuple[Optional[datetime], str]] = None,
+        columns: str = "*"
+    ) -> Tuple[str, List]:
         """
         Build SQL query for searching jobs with filters.
         
         Args:
-            keyword: Search term for job title and description
+            keyword: Search term for the job title
             location: Location filter
             company: Company name filter
             days: Number of days since posting
             sort: Sort order
             page: Page number
-            limit: Results per page
+            limit: Results per page; 0 returns all matching rows
+            after: (activation_time, id) of the previous page's last row,
+                activation_time None for undated jobs; only used for
+                paginated date-sorted searches
+            columns: SQL select list (trusted text, not a user value)
             
         Returns:
-            Tuple containing:
-            - Main query string
-            - Parameters for main query
-            - Count query string
-            - Parameters for count query
-        """
-        # Base query
-        base_query = f"""
-        SELECT * FROM {self.db_manager.schema}.jobs
-        WHERE 1=1
-        """
-        
-        # Base count query
-        count_query = f"""
-        SELECT COUNT(*) FROM {self.db_manager.schema}.jobs
-        WHERE 1=1
+            Tuple of query string and query parameters. Paginated queries
+            also return the total number of matches in a _total column
+            (with `after`, only the matches from that position on).
         """
+        has_days = bool(days and days.isdigit())
+        keyset = bool(after and limit and sort == 'date')
+        keyset_null = keyset and after[0] is None
+        # Only relevance-sorted keyword searches need pg_trgm's similarity()
+        trigram = sort != 'relevance' or not keyword or self._has_pg_trgm
+        query = _compile_search_sql(
+            self.db_manager.schema, columns, bool(keyword), bool(location), bool(company),
+            has_days, sort, bool(limit), keyset, keyset_null, trigram
+        )
         
+        # Parameters in the order of the placeholders in the compiled SQL
         params = []
-        count_params = []
-        
-        # Add keyword filter (search in title, description)
         if keyword:
-            base_query += " AND (title ILIKE %s OR description ILIKE %s)"
-            count_query += " AND (title ILIKE %s OR description ILIKE %s)"
-            keyword_param = f'%{keyword}%'
-            params.extend([keyword_param, keyword_param])
-            count_params.extend([keyword_param, keyword_param])
-        
-        # Add location filter
+            params.append(f'%{keyword}%')
         if location:
-            base_query += " AND locations::text ILIKE %s"
-            count_query += " AND locations::text ILIKE %s"
-            location_param = f'%{location}%'
-            params.append(location_param)
-            count_params.append(location_param)
-        
-        # Add company filter (search in company_name_en, company_name_fa)
+            params.append(f'%{location}%')
         if company:
-            base_query += " AND (company_name_en ILIKE %s OR company_name_fa ILIKE %s)"
-            count_query += " AND (company_name_en ILIKE %s OR company_name_fa ILIKE %s)"
             company_param = f'%{company}%'
             params.extend([company_param, company_param])
-            count_params.extend([company_param, company_param])
-        
-        # Add date filter
-        if days and days.isdigit():
-            days_ago = datetime.now() - timedelta(days=int(days))
-            base_query += " AND activation_time >= %s"
-            count_query += " AND activation_time >= %s"
-            params.append(days_ago)
-            count_params.append(days_ago)
-        
-        # Add sorting
-        if sort == 'date':
-            base_query += " ORDER BY activation_time DESC NULLS LAST"
-        elif sort == 'company':
-            base_query += " ORDER BY company_name_en ASC NULLS LAST, company_name_fa ASC NULLS LAST"
-        elif sort == 'relevance':
-            if keyword:
-                # Simple relevance sort using similarity with the keyword
-                base_query += " ORDER BY CASE WHEN title ILIKE %s THEN 0 ELSE 1 END, activation_time DESC NULLS LAST"
-                params.append(f'%{keyword}%')
-            else:
-                base_query += " ORDER BY activation_time DESC NULLS LAST"
+        if has_days:
+            params.append(datetime.now() - timedelta(days=int(days)))
+        if keyset_null:
+            params.append(after[1])
+        elif keyset:
+            params.extend(after)
+        if sort == 'relevance' and keyword:
+            params.append(keyword if trigram else f'%{keyword}%')
+        if keyset:
+            params.append(limit)
+        elif limit:
+            params.extend([limit, (page - 1) * limit])
         
-        # Add pagination
-        offset = (page - 1) * limit
-        base_query += f" LIMIT %s OFFSET %s"
-        params.extend([limit, offset])
-        
-        return base_query, params, count_query, count_params
+        return query, params
     
     def job_details(self, job_id):
         """Display detailed information about a specific job."""
         try:
-            # Connect to database
-            conn = psycopg2.connect(self._build_db_connection_string())
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-            
-            # Query for job details
-            query = f"SELECT * FROM {self.db_manager.schema}.jobs WHERE id = %s"
-            cursor.execute(query, (job_id,))
-            job_data = cursor.fetchone()
-            
-            # Close connection
-            cursor.close()
-            conn.close()
+            with self._cursor() as cursor:
+                # Query for job details
+                query = f"SELECT * FROM {self.db_manager.schema}.jobs WHERE id = %s"
+                cursor.execute(query, (job_id,))
+                job_data = cursor.fetchone()
             
             if not job_data:
                 flash(f"Job with ID {job_id} not found", "error")
@@ -1252,14 +2096,6 @@ class JobScraperWebApp:
             # Convert to dictionary
             job = dict(job_data)
             
-            # Process JSON fields
-            for field in ['locations', 'work_types', 'tags', 'job_post_categories', 'salary']:
-                if field in job and job[field] and isinstance(job[field], str):
-                    try:
-                        job[field] = json.loads(job[field])
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-            
             return render_template('job_details.html', job=job)
             
         except Exception as e:
@@ -1280,27 +2116,21 @@ class JobScraperWebApp:
             days = request.args.get('days', search_params.get('days', ''))
             sort = request.args.get('sort', search_params.get('sort', 'date'))
             
-            # Connect to database
-            conn = psycopg2.connect(self._build_db_connection_string())
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+            # Optional ?columns=title,url,... for narrower exports
+            columns = "*"
+            requested_columns = [c.strip() for c in request.args.get('columns', '').split(',') if c.strip()]
+            if requested_columns:
+                unknown = [c for c in requested_columns if c not in EXPORTABLE_JOB_COLUMNS]
+                if unknown:
+                    flash(f"Unknown export columns: {', '.join(unknown)}", "error")
+                    return redirect(url_for('search_jobs'))
+                columns = ", ".join(requested_columns)
             
             # Build query for all results (no pagination)
-            query, params, _, _ = self._build_search_query(
-                keyword, location, company, days, sort, 1, 10000  # Large limit to get all results
+            query, params = self._build_search_query(
+                keyword, location, company, days, sort, 1, 0, columns=columns
             )
             
-            # Remove the pagination part (LIMIT/OFFSET)
-            query = query.split('LIMIT')[0].strip()
-            params = params[:-2]  # Remove the last two parameters (limit, offset)
-            
-            # Execute query
-            cursor.execute(query, params)
-            jobs = [dict(row) for row in cursor.fetchall()]
-            
-            # Close connection
-            cursor.close()
-            conn.close()
-            
             # Format the filename with search parameters
             params_str = []
             if keyword:
@@ -1319,51 +2149,27 @@ class JobScraperWebApp:
             filename_base = secure_filename(filename_base)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
-            # Create DataFrame from jobs
-            df = pd.DataFrame(jobs)
-            
             # Export in requested format
-            if format == 'csv':
-                output = io.StringIO()
-                df.to_csv(output, index=False, encoding='utf-8')
-                output.seek(0)
-                
-                return send_file(
-                    io.BytesIO(output.getvalue().encode('utf-8')),
-                    mimetype='text/csv',
-                    as_attachment=True,
-                    attachment_filename=f"{filename_base}_{timestamp}.csv"
-                )
-                
-            elif format == 'json':
-                # Process JSON columns before export
-                for job in jobs:
-                    for field in ['locations', 'work_types', 'tags', 'job_post_categories', 'salary']:
-                        if field in job and job[field] and isinstance(job[field], str):
-                            try:
-                                job[field] = json.loads(job[field])
-                            except (json.JSONDecodeError, TypeError):
-                                pass
-                
-                output = json.dumps(jobs, default=str, ensure_ascii=False, indent=2)
-                
-                return send_file(
-                    io.BytesIO(output.encode('utf-8')),
-                    mimetype='application/json',
-                    as_attachment=True,
-                    attachment_filename=f"{filename_base}_{timestamp}.json"
+            if format in ('csv', 'json'):
+                # Rows are streamed from a server-side cursor straight into
+                # the response instead of being collected in memory first
+                return Response(
+                    stream_with_context(self._stream_search_export(query, params, format)),
+                    mimetype='text/csv' if format == 'csv' else 'application/json',
+                    headers={
+                        'Content-Disposition':
+                            f'attachment; filename="{filename_base}_{timestamp}.{format}"'
+                    }
                 )
                 
             elif format == 'excel':
-                output = io.BytesIO()
-                df.to_excel(output, index=False, engine='openpyxl')
-                output.seek(0)
+                output = self._write_search_excel(query, params)
                 
                 return send_file(
                     output,
                     mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
                     as_attachment=True,
-                    attachment_filename=f"{filename_base}_{timestamp}.xlsx"
+                    download_name=f"{filename_base}_{timestamp}.xlsx"
                 )
                 
             else:
@@ -1375,6 +2181,90 @@ class JobScraperWebApp:
             flash(f"Error exporting search results: {str(e)}", "error")
             return redirect(url_for('search_jobs'))
 
+    def _stream_search_export(self, query: str, params: List, format_type: str) -> Iterator[bytes]:
+        """
+        Yield a search export as CSV or JSON chunks.
+        
+        Rows come from a server-side cursor EXPORT_FETCH_SIZE at a time, so
+        neither the rows nor the serialized output are held in memory.
+        
+        Args:
+            query: Search query without pagination
+            params: Query parameters
+            format_type: 'csv' or 'json'
+        """
+        with self._cursor(
+            cursor_factory=psycopg2.extras.RealDictCursor,
+            name='search_export_cursor'
+        ) as cursor:
+            cursor.itersize = EXPORT_FETCH_SIZE
+            cursor.execute(query, params)
+            
+            if format_type == 'json':
+                count = 0
+                yield b'['
+                for job in cursor:
+                    yield (b',\n  ' if count else b'\n  ') + orjson.dumps(job, default=str)
+                    count += 1
+                yield b'\n]\n' if count else b']\n'
+            else:
+                buffer = io.StringIO()
+                writer = None
+                for job in cursor:
+                    if writer is None:
+                        writer = csv.DictWriter(buffer, fieldnames=list(job.keys()))
+                        writer.writeheader()
+                    writer.writerow(job)
+                    if buffer.tell() >= COPY_BUFFER_SIZE:
+                        yield buffer.getvalue().encode('utf-8')
+                        buffer.seek(0)
+                        buffer.truncate()
+                if buffer.tell():
+                    yield buffer.getvalue().encode('utf-8')
+
+    def _write_search_excel(self, query: str, params: List) -> io.BytesIO:
+        """
+        Write search results to an in-memory XLSX workbook.
+        
+        Rows go from a server-side cursor straight into the sheet. xlsxwriter
+        in constant-memory mode flushes each row to a temp file as it is
+        written; without it, an openpyxl write-only sheet is used.
+        """
+        output = io.BytesIO()
+        
+        with self._cursor(cursor_factory=None, name='search_excel_cursor') as cursor:
+            cursor.itersize = EXPORT_FETCH_SIZE
+            cursor.execute(query, params)
+            
+            def sheet_rows():
+                header_written = False
+                for row in cursor:
+                    if not header_written:
+                        yield [column[0] for column in cursor.description]
+                        header_written = True
+                    yield [_excel_value(value) for value in row]
+            
+            if xlsxwriter is not None:
+                workbook = xlsxwriter.Workbook(output, {
+                    'constant_memory': True,
+                    'tmpdir': tempfile.gettempdir(),
+                    'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+                })
+                sheet = workbook.add_worksheet('jobs')
+                for row_number, values in enumerate(sheet_rows()):
+                    sheet.write_row(row_number, 0, values)
+                workbook.close()
+            else:
+                import openpyxl
+                workbook = openpyxl.Workbook(write_only=True)
+                sheet = workbook.create_sheet('jobs')
+                for values in sheet_rows():
+                    sheet.append(values)
+                workbook.save(output)
+        
+        output.seek(0)
+        return output
+
     def analytics(self):
         """
         Display analytics dashboard with Superset integration.
@@ -1382,6 +2272,8 @@ class JobScraperWebApp:
         This route provides access to the Superset dashboards or embeds 
         specific visualizations from Superset.
         """
+        import requests
+        
         try:
             # Get Superset base URL from environment or config
             superset_url = os.environ.get(
@@ -1398,27 +2290,11 @@ class JobScraperWebApp:
             except (requests.RequestException, ConnectionError):
                 pass  # Superset is not available
                 
-            # Get dashboard details (configurable)
-            dashboards = [
-                {
-                    "title": "Job Market Trends",
-                    "id": "job-market-trends",
-                    "description": "Overview of job posting trends and metrics",
-                    "url": f"{superset_url}/superset/dashboard/job-market-trends/"
-                },
-                {
-                    "title": "Salary Analysis",
-                    "id": "salary-analysis",
-                    "description": "Analysis of salary distributions across jobs",
-                    "url": f"{superset_url}/superset/dashboard/salary-analysis/"
-                }
-            ]
-            
             return render_template(
                 'analytics.html',
                 superset_url=superset_url,
                 superset_available=superset_available,
-                dashboards=dashboards
+                dashboards=_analytics_dashboards(superset_url)
             )
             
         except Exception as e:
@@ -1430,21 +2306,29 @@ class JobScraperWebApp:
 app = None
 
 def create_app(
-    config_path: str = "config/api_config.yaml",
+    config_path: Optional[str] = None,
     db_connection_string: Optional[str] = None,
-    debug: bool = False
+    debug: Optional[bool] = None
 ) -> Flask:
     """
     Create and configure a Flask application instance.
     
+    This is the entry point used by gunicorn (``src.web_app:create_app()``),
+    so unspecified arguments are taken from the environment.
+    
     Args:
-        config_path: Path to the configuration file
+        config_path: Path to the configuration file (defaults to CONFIG_PATH)
         db_connection_string: Database connection string (optional)
-        debug: Whether to enable debug mode
+        debug: Whether to enable debug mode (defaults to FLASK_DEBUG)
         
     Returns:
         Configured Flask application
     """
+    if config_path is None:
+        config_path = os.environ.get("CONFIG_PATH", "config/api_config.yaml")
+    if debug is None:
+        debug = os.environ.get("FLASK_DEBUG", "0") == "1"
+    
     try:
         # Create and configure the web application
         webapp = JobScraperWebApp(
@@ -1460,22 +2344,10 @@ def create_app(
         def inject_current_year():
             return {"current_year": datetime.now().year}
         
-        # Test database connection
-        conn = None
-        try:
-            conn = psycopg2.connect(
-                webapp._build_db_connection_string(),
-                connect_timeout=5
-            )
-            logger.info("Database connection successful")
-        except Exception as e:
-            logger.error(f"Error connecting to database: {str(e)}")
-            ERRORS.labels(type="database_connection").inc()
-        finally:
-            if conn:
-                conn.close()
+        # Close pooled connections when the worker exits
+        atexit.register(webapp.close_db_pool)
                 
-        # Initialize components synchronously
+        # Initialize components synchronously (this also warms the pool)
         webapp._initialize_managers_sync()
         
         # Setup monitoring
@@ -9,11 +9,21 @@ import sys
 import time
 import json
 import argparse
+import asyncio
+import csv
+import io
 import random
 import logging
 from datetime import datetime
-import urllib.request
-import urllib.error
+
+import aiohttp
+
+try:
+    import orjson
+    loads_json = orjson.loads
+except ImportError:
+    # orjson is optional; the stdlib parser also accepts bytes
+    loads_json = json.loads
 
 # Configure logging
 logging.basicConfig(
@@ -38,38 +48,60 @@ def parse_args():
                         help='Output results in CSV format')
     return parser.parse_args()
 
-def check_service(url, service_name):
-    """Check if a service is accessible."""
+# Every probe gives up after this many seconds
+REQUEST_TIMEOUT = 5
+
+# Keep-alive connections per host; Prometheus queries share these instead of
+# opening a new connection each
+CONNECTIONS_PER_HOST = 4
+
+# In-flight and finished service probes of the current run, keyed by URL
+_service_checks = {}
+
+async def check_service(session, url, service_name):
+    """Check if a service is accessible.
+    
+    Services sharing a URL (e.g. everything behind one proxy) are probed once
+    per run; later callers await the same result.
+    """
+    task = _service_checks.get(url)
+    if task is None:
+        task = asyncio.ensure_future(_probe_service(session, url, service_name))
+        _service_checks[url] = task
+    return await task
+
+async def _probe_service(session, url, service_name):
+    """Request a service URL and report whether it answered with 200."""
     try:
         logger.debug(f"Checking {service_name} at {url}")
-        response = urllib.request.urlopen(url, timeout=5)
-        return response.status == 200
-    except (urllib.error.URLError, urllib.error.HTTPError, ConnectionError) as e:
+        async with session.get(url) as response:
+            return response.status == 200
+    except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as e:
         logger.debug(f"Error checking {service_name}: {e}")
         return False
     except Exception as e:
         logger.debug(f"Unexpected error checking {service_name}: {e}")
         return False
 
-def check_metrics_endpoint(web_app_url):
+async def check_metrics_endpoint(session, web_app_url):
     """Check if the metrics endpoint is available on the web app."""
     try:
         logger.debug(f"Checking metrics endpoint at {web_app_url}/metrics")
-        response = urllib.request.urlopen(f"{web_app_url}/metrics", timeout=5)
-        return response.status == 200
-    except (urllib.error.URLError, urllib.error.HTTPError, ConnectionError) as e:
+        async with session.get(f"{web_app_url}/metrics") as response:
+            return response.status == 200
+    except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as e:
         logger.debug(f"Error checking metrics endpoint: {e}")
         return False
     except Exception as e:
         logger.debug(f"Unexpected error checking metrics endpoint: {e}")
         return False
 
-def check_prometheus_targets(prometheus_url):
+async def check_prometheus_targets(session, prometheus_url):
     """Check Prometheus targets and their status."""
     try:
         logger.debug(f"Checking Prometheus targets at {prometheus_url}/api/v1/targets")
-        response = urllib.request.urlopen(f"{prometheus_url}/api/v1/targets", timeout=5)
-        data = json.loads(response.read().decode('utf-8'))
+        async with session.get(f"{prometheus_url}/api/v1/targets") as response:
+            data = loads_json(await response.read())
         
         targets = []
         up_count = 0
@@ -94,95 +126,121 @@ def check_prometheus_targets(prometheus_url):
             'up_count': up_count,
             'total_count': total_count
         }
-    except (urllib.error.URLError, urllib.error.HTTPError, ConnectionError) as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as e:
         logger.debug(f"Error checking Prometheus targets: {e}")
         return {'success': False, 'error': str(e)}
     except Exception as e:
         logger.debug(f"Unexpected error checking Prometheus targets: {e}")
         return {'success': False, 'error': str(e)}
 
-def check_grafana_datasources(grafana_url):
+async def check_grafana_datasources(session, grafana_url):
     """Check Grafana datasources."""
     try:
         # This is a simple check, in production you'd need proper authentication
         logger.debug(f"Checking Grafana datasources at {grafana_url}/api/datasources")
         
         # We can't easily check this without authentication, so we'll just check if login page loads
-        response = urllib.request.urlopen(f"{grafana_url}/login", timeout=5)
-        return response.status == 200
-    except (urllib.error.URLError, urllib.error.HTTPError, ConnectionError) as e:
+        async with session.get(f"{grafana_url}/login") as response:
+            return response.status == 200
+    except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as e:
         logger.debug(f"Error checking Grafana datasources: {e}")
         return False
     except Exception as e:
         logger.debug(f"Unexpected error checking Grafana datasources: {e}")
         return False
 
-def validate_prometheus_queries(prometheus_url, queries):
-    """Run validation queries against Prometheus."""
-    results = []
-    
-    for query_name, query in queries.items():
-        try:
-            logger.debug(f"Running Prometheus query '{query_name}': {query}")
-            encoded_query = urllib.parse.quote(query)
-            url = f"{prometheus_url}/api/v1/query?query={encoded_query}"
-            response = urllib.request.urlopen(url, timeout=5)
-            data = json.loads(response.read().decode('utf-8'))
-            
-            if data['status'] == 'success':
-                has_data = len(data.get('data', {}).get('result', [])) > 0
-                results.append({
-                    'name': query_name,
-                    'success': True,
-                    'has_data': has_data
-                })
-            else:
-                results.append({
-                    'name': query_name,
-                    'success': False,
-                    'error': 'Query returned unsuccessful status'
-                })
-        except Exception as e:
-            logger.debug(f"Error running query '{query_name}': {e}")
-            results.append({
+async def run_prometheus_query(session, query_url, query_name, query):
+    """Run a single validation query against the Prometheus query API."""
+    try:
+        logger.debug(f"Running Prometheus query '{query_name}': {query}")
+        async with session.get(query_url, params={'query': query}) as response:
+            data = loads_json(await response.read())
+        
+        if data['status'] == 'success':
+            has_data = len(data.get('data', {}).get('result', [])) > 0
+            return {
                 'name': query_name,
-                'success': False,
-                'error': str(e)
-            })
+                'success': True,
+                'has_data': has_data
+            }
+        return {
+            'name': query_name,
+            'success': False,
+            'error': 'Query returned unsuccessful status'
+        }
+    except Exception as e:
+        logger.debug(f"Error running query '{query_name}': {e}")
+        return {
+            'name': query_name,
+            'success': False,
+            'error': str(e)
+        }
+
+async def validate_prometheus_queries(session, prometheus_url, queries):
+    """Run validation queries against Prometheus concurrently."""
+    query_url = f"{prometheus_url}/api/v1/query"
+    results = await asyncio.gather(*[
+        run_prometheus_query(session, query_url, query_name, query)
+        for query_name, query in queries.items()
+    ])
+    return list(results)
+
+async def _run_checks(args, validation_queries):
+    """Run every probe concurrently on one HTTP session."""
+    # Probes from an earlier run belong to a closed event loop
+    _service_checks.clear()
     
-    return results
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit_per_host=CONNECTIONS_PER_HOST, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, raise_for_status=False) as session:
+        return await asyncio.gather(
+            check_service(session, args.prometheus_url, 'Prometheus'),
+            check_service(session, args.grafana_url, 'Grafana'),
+            check_service(session, args.web_app_url, 'Web App'),
+            check_metrics_endpoint(session, args.web_app_url),
+            check_prometheus_targets(session, args.prometheus_url),
+            check_grafana_datasources(session, args.grafana_url),
+            validate_prometheus_queries(session, args.prometheus_url, validation_queries)
+        )
 
 def run_tests(args):
     """Run all monitoring tests."""
     test_results = {}
+    validation_queries = {
+        'up': 'up',
+        'job_count': 'job_scraper_total_jobs',
+        'errors': 'job_scraper_errors_total',
+        'api_requests': 'job_scraper_api_requests_total'
+    }
+    
+    # The probes are independent, so they all run at once and the results of
+    # the dependent ones are discarded below when their service is down
+    (prometheus_accessible, grafana_accessible, web_app_accessible, metrics_endpoint,
+     prometheus_targets, grafana_datasources, prometheus_queries) = asyncio.run(
+        _run_checks(args, validation_queries)
+    )
     
     # Check if services are accessible
-    test_results['prometheus_accessible'] = check_service(args.prometheus_url, 'Prometheus')
-    test_results['grafana_accessible'] = check_service(args.grafana_url, 'Grafana')
-    test_results['web_app_accessible'] = check_service(args.web_app_url, 'Web App')
-    test_results['metrics_endpoint'] = check_metrics_endpoint(args.web_app_url) if test_results['web_app_accessible'] else False
+    test_results['prometheus_accessible'] = prometheus_accessible
+    test_results['grafana_accessible'] = grafana_accessible
+    test_results['web_app_accessible'] = web_app_accessible
+    test_results['metrics_endpoint'] = metrics_endpoint if web_app_accessible else False
     
     # Check Prometheus targets
-    if test_results['prometheus_accessible']:
-        test_results['prometheus_targets'] = check_prometheus_targets(args.prometheus_url)
+    if prometheus_accessible:
+        test_results['prometheus_targets'] = prometheus_targets
     else:
         test_results['prometheus_targets'] = {'success': False, 'error': 'Prometheus not accessible'}
     
     # Check Grafana datasources
-    if test_results['grafana_accessible']:
-        test_results['grafana_datasources'] = check_grafana_datasources(args.grafana_url)
+    if grafana_accessible:
+        test_results['grafana_datasources'] = grafana_datasources
     else:
         test_results['grafana_datasources'] = False
     
-    # Run validation queries against Prometheus
-    if test_results['prometheus_accessible']:
-        validation_queries = {
-            'up': 'up',
-            'job_count': 'job_scraper_total_jobs',
-            'errors': 'job_scraper_errors_total',
-            'api_requests': 'job_scraper_api_requests_total'
-        }
-        test_results['prometheus_queries'] = validate_prometheus_queries(args.prometheus_url, validation_queries)
+    # Validation queries against Prometheus
+    if prometheus_accessible:
+        test_results['prometheus_queries'] = prometheus_queries
     else:
         test_results['prometheus_queries'] = []
     
@@ -190,84 +248,91 @@ def run_tests(args):
 
 def print_test_results(results, csv_format=False):
     """Print the test results."""
+    # The report is assembled in memory and written to stdout in one go
+    buf = io.StringIO()
+    
     if csv_format:
-        print("test,result")
-        print(f"prometheus_accessible,{results['prometheus_accessible']}")
-        print(f"grafana_accessible,{results['grafana_accessible']}")
-        print(f"web_app_accessible,{results['web_app_accessible']}")
-        print(f"metrics_endpoint,{results['metrics_endpoint']}")
+        writer = csv.writer(buf, lineterminator='\n')
+        writer.writerow(['test', 'result'])
+        writer.writerow(['prometheus_accessible', results['prometheus_accessible']])
+        writer.writerow(['grafana_accessible', results['grafana_accessible']])
+        writer.writerow(['web_app_accessible', results['web_app_accessible']])
+        writer.writerow(['metrics_endpoint', results['metrics_endpoint']])
         
         if results['prometheus_accessible'] and results['prometheus_targets']['success']:
-            print(f"prometheus_targets_up,{results['prometheus_targets']['up_count']}")
-            print(f"prometheus_targets_total,{results['prometheus_targets']['total_count']}")
+            writer.writerow(['prometheus_targets_up', results['prometheus_targets']['up_count']])
+            writer.writerow(['prometheus_targets_total', results['prometheus_targets']['total_count']])
         
-        print(f"grafana_datasources,{results['grafana_datasources']}")
+        writer.writerow(['grafana_datasources', results['grafana_datasources']])
         
         for query in results['prometheus_queries']:
-            print(f"prometheus_query_{query['name']},{query['success']}")
+            writer.writerow([f"prometheus_query_{query['name']}", query['success']])
     else:
-        print("\n=== Job Scraper Monitoring Test Results ===")
-        print(f"Test run time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("\n1. Service Accessibility:")
-        print(f"   - Prometheus: {'✅ Accessible' if results['prometheus_accessible'] else '❌ Not accessible'}")
-        print(f"   - Grafana: {'✅ Accessible' if results['grafana_accessible'] else '❌ Not accessible'}")
-        print(f"   - Web App: {'✅ Accessible' if results['web_app_accessible'] else '❌ Not accessible'}")
-        print(f"   - Metrics Endpoint: {'✅ Available' if results['metrics_endpoint'] else '❌ Not available'}")
+        print("\n=== Job Scraper Monitoring Test Results ===", file=buf)
+        print(f"Test run time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=buf)
+        print("\n1. Service Accessibility:", file=buf)
+        print(f"   - Prometheus: {'✅ Accessible' if results['prometheus_accessible'] else '❌ Not accessible'}", file=buf)
+        print(f"   - Grafana: {'✅ Accessible' if results['grafana_accessible'] else '❌ Not accessible'}", file=buf)
+        print(f"   - Web App: {'✅ Accessible' if results['web_app_accessible'] else '❌ Not accessible'}", file=buf)
+        print(f"   - Metrics Endpoint: {'✅ Available' if results['metrics_endpoint'] else '❌ Not available'}", file=buf)
         
-        print("\n2. Prometheus Targets:")
+        print("\n2. Prometheus Targets:", file=buf)
         if results['prometheus_accessible'] and results['prometheus_targets']['success']:
             targets = results['prometheus_targets']['targets']
             up_count = results['prometheus_targets']['up_count']
             total_count = results['prometheus_targets']['total_count']
-            print(f"   - Status: {up_count}/{total_count} targets up")
+            print(f"   - Status: {up_count}/{total_count} targets up", file=buf)
             
             for target in targets:
                 status_icon = '✅' if target['status'] == 'up' else '❌'
-                print(f"   - {status_icon} {target['name']}: {target['status']}")
+                print(f"   - {status_icon} {target['name']}: {target['status']}", file=buf)
         else:
-            print("   - Unable to retrieve target information")
+            print("   - Unable to retrieve target information", file=buf)
         
-        print("\n3. Grafana Setup:")
-        print(f"   - Datasources: {'✅ Available' if results['grafana_datasources'] else '❌ Not available or requires authentication'}")
+        print("\n3. Grafana Setup:", file=buf)
+        print(f"   - Datasources: {'✅ Available' if results['grafana_datasources'] else '❌ Not available or requires authentication'}", file=buf)
         
-        print("\n4. Prometheus Queries:")
+        print("\n4. Prometheus Queries:", file=buf)
         if results['prometheus_queries']:
             for query in results['prometheus_queries']:
                 if query['success']:
                     data_status = '✅ Has data' if query.get('has_data', False) else '⚠️ No data'
-                    print(f"   - ✅ {query['name']}: Success - {data_status}")
+                    print(f"   - ✅ {query['name']}: Success - {data_status}", file=buf)
                 else:
-                    print(f"   - ❌ {query['name']}: Failed - {query.get('error', 'Unknown error')}")
+                    print(f"   - ❌ {query['name']}: Failed - {query.get('error', 'Unknown error')}", file=buf)
         else:
-            print("   - No query validation performed")
+            print("   - No query validation performed", file=buf)
         
-        print("\n=== Overall Assessment ===")
+        print("\n=== Overall Assessment ===", file=buf)
         if (results['prometheus_accessible'] and 
             results['grafana_accessible'] and 
             results['web_app_accessible'] and 
             results['metrics_endpoint']):
-            print("✅ Basic monitoring setup is COMPLETE")
+            print("✅ Basic monitoring setup is COMPLETE", file=buf)
             
             if (results['prometheus_targets']['success'] and 
                 results['prometheus_targets']['up_count'] > 0):
-                print("✅ Prometheus is scraping targets successfully")
+                print("✅ Prometheus is scraping targets successfully", file=buf)
             else:
-                print("⚠️ Prometheus is not scraping all targets")
+                print("⚠️ Prometheus is not scraping all targets", file=buf)
             
             if results['grafana_datasources']:
-                print("✅ Grafana appears to be set up correctly")
+                print("✅ Grafana appears to be set up correctly", file=buf)
             else:
-                print("⚠️ Grafana may need configuration or authentication")
+                print("⚠️ Grafana may need configuration or authentication", file=buf)
             
             query_success = all(q['success'] for q in results['prometheus_queries'])
             if query_success:
-                print("✅ Prometheus queries are working")
+                print("✅ Prometheus queries are working", file=buf)
             else:
-                print("⚠️ Some Prometheus queries failed")
+                print("⚠️ Some Prometheus queries failed", file=buf)
         else:
-            print("❌ Basic monitoring setup is INCOMPLETE")
+            print("❌ Basic monitoring setup is INCOMPLETE", file=buf)
         
-        print("\nFor detailed instructions on completing the setup, refer to MONITORING.md")
+        print("\nFor detailed instructions on completing the setup, refer to MONITORING.md", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 def main():
     """Main function."""
@@ -0,0 +1,7 @@
+-- Covering index for the dashboard's recent-jobs query
+-- (ORDER BY activation_time DESC NULLS LAST LIMIT 10), so it can be served
+-- by an index-only scan instead of sorting the whole table.
+-- CONCURRENTLY keeps the table writable when applied to an existing database.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_activation_time_desc_idx
+    ON public.jobs (activation_time DESC NULLS LAST)
+    INCLUDE (id, title, company_name_en, url);
@@ -0,0 +1,14 @@
+-- Trigram indexes for the search page's substring filters
+-- (title/description/company ILIKE '%term%'). A leading wildcard cannot use
+-- a btree index, but pg_trgm GIN indexes serve ILIKE directly.
+-- CONCURRENTLY keeps the table writable when applied to an existing database.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_title_trgm_idx
+    ON public.jobs USING gin (title gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_description_trgm_idx
+    ON public.jobs USING gin (description gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_company_name_en_trgm_idx
+    ON public.jobs USING gin (company_name_en gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_company_name_fa_trgm_idx
+    ON public.jobs USING gin (company_name_fa gin_trgm_ops);
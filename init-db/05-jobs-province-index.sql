@@ -0,0 +1,6 @@
+-- Expression index for the per-province job counts in /api/stats
+-- (locations->0->'province'->>'name'), so the filter and grouping read the
+-- indexed value instead of casting every locations document to text.
+-- CONCURRENTLY keeps the table writable when applied to an existing database.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_province_idx
+    ON public.jobs ((locations->0->'province'->>'name'));
@@ -0,0 +1,7 @@
+-- Index matching the keyset pagination order used by the search page and
+-- /api/jobs: ORDER BY activation_time DESC NULLS LAST, id DESC with
+-- WHERE (activation_time, id) < (...). Each page becomes a short index range
+-- scan regardless of how deep it is.
+-- CONCURRENTLY keeps the table writable when applied to an existing database.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_activation_time_id_idx
+    ON public.jobs (activation_time DESC NULLS LAST, id DESC);
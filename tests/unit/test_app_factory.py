@@ -13,6 +13,8 @@ import yaml
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 
 from app import create_app
+from app.utils import yaml_loader
+from app.utils.yaml_loader import SafeDumper
 
 
 class TestAppFactory(unittest.TestCase):
@@ -42,13 +44,16 @@ class TestAppFactory(unittest.TestCase):
             }
         }
         
-        yaml.dump(config, self.config_file)
+        yaml.dump(config, self.config_file, Dumper=SafeDumper)
         self.config_file.close()
     
     def tearDown(self):
         """Clean up after tests."""
         # Remove temporary config file
         os.unlink(self.config_path)
+        if os.path.exists(self.config_path + '.json'):
+            os.unlink(self.config_path + '.json')
+        yaml_loader.clear()
     
     def test_create_app_with_config_file(self):
         """Test creating app with configuration file."""
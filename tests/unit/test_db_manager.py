@@ -14,6 +14,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 # Assuming we have a DatabaseManager class in app.db.manager
 from app.db.manager import DatabaseManager
+from app.utils import yaml_loader
+from app.utils.yaml_loader import SafeDumper
 
 
 class TestDatabaseManager(unittest.TestCase):
@@ -36,7 +38,7 @@ class TestDatabaseManager(unittest.TestCase):
             }
         }
         
-        yaml.dump(config, self.config_file)
+        yaml.dump(config, self.config_file, Dumper=SafeDumper)
         self.config_file.close()
         
         # Create database manager
@@ -46,6 +48,9 @@ class TestDatabaseManager(unittest.TestCase):
         """Clean up after tests."""
         # Remove temporary config file
         os.unlink(self.config_path)
+        if os.path.exists(self.config_path + '.json'):
+            os.unlink(self.config_path + '.json')
+        yaml_loader.clear()
         
         # Close database connections
         if hasattr(self, 'db_manager'):
@@ -0,0 +1,56 @@
+"""
+Smoke tests for the WSGI entry point.
+"""
+
+import unittest
+from unittest.mock import patch
+import importlib
+import os
+import sys
+import tempfile
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+
+class TestWsgi(unittest.TestCase):
+    """Test cases for wsgi.py."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Import wsgi once against a throwaway SQLite database."""
+        cls.db_dir = tempfile.TemporaryDirectory()
+        database_url = 'sqlite:///' + os.path.join(cls.db_dir.name, 'test.db')
+        with patch.dict(os.environ, {'DATABASE_URL': database_url}):
+            cls.wsgi = importlib.import_module('wsgi')
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the throwaway database."""
+        cls.db_dir.cleanup()
+
+    def test_app_created(self):
+        """Test that importing wsgi creates the application."""
+        self.assertEqual(self.wsgi.app.name, 'app')
+        self.assertIn('metrics', self.wsgi.app.blueprints)
+
+    def test_mappers_configured(self):
+        """Test that the ORM mappers are configured at import."""
+        from app.db.models import Job, Tag, ScraperRun
+
+        for model in (Job, Tag, ScraperRun):
+            self.assertTrue(model.__mapper__.configured)
+
+    def test_first_request_creates_tables(self):
+        """Test that the first request creates the database tables."""
+        from sqlalchemy import inspect
+        from app.db import Session
+
+        self.wsgi.app.test_client().get('/metrics')
+
+        table_names = inspect(Session.get_bind()).get_table_names()
+        self.assertIn('jobs', table_names)
+
+
+if __name__ == '__main__':
+    unittest.main()
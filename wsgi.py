@@ -1,13 +1,21 @@
 """
 WSGI entry point for the Job Scraper application.
-This file is used by Gunicorn to serve the application.
+This file is used by Gunicorn to serve the application, preferably with
+preloading so that the setup below runs once in the master process:
+
+    gunicorn --preload wsgi:app
 """
 import os
+from sqlalchemy.orm import configure_mappers
 from app import create_app
 
 # Create the Flask application instance
 app = create_app()
 
+# Configure all ORM mappers now rather than on first query, so that with
+# --preload the work happens once before workers are forked
+configure_mappers()
+
 if __name__ == "__main__":
     # Run the app only if this file is executed directly
     port = int(os.environ.get("PORT", 5000))